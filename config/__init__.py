@@ -6,22 +6,32 @@ from .parameters import (
     StrategyParameters,
     TradingTier,
     TierConfig,
+    RegimeParameters,
+    CostModel,
     TIER_CONFIGS,
     REGIME_PARAMETERS,
     COST_MODEL,
     SAFE_SYMBOLS,
+    SAFE_SYMBOLS_SET,
     COMPETITION_CONFIG,
     get_parameters,
+    get_regime_parameters,
+    get_cost_model,
 )
 
 __all__ = [
     "StrategyParameters",
     "TradingTier",
     "TierConfig",
+    "RegimeParameters",
+    "CostModel",
     "TIER_CONFIGS",
     "REGIME_PARAMETERS",
     "COST_MODEL",
     "SAFE_SYMBOLS",
+    "SAFE_SYMBOLS_SET",
     "COMPETITION_CONFIG",
     "get_parameters",
+    "get_regime_parameters",
+    "get_cost_model",
 ]
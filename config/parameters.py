@@ -12,8 +12,11 @@ Note: This file contains parameter structure only.
 """
 
 import os
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
 from enum import Enum
 
 
@@ -24,7 +27,7 @@ class TradingTier(str, Enum):
     BOOST = "boost"        # Aggressive
 
 
-@dataclass
+@dataclass(slots=True)
 class TierConfig:
     """Configuration for each trading tier."""
     name: str
@@ -56,7 +59,19 @@ def _load_tier_configs():
         TIER_CONFIGS[tier] = TierConfig.from_production(tier.value)
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _get_tier_configs() -> Mapping[TradingTier, TierConfig]:
+    """
+    Load tier configurations once per process.
+
+    Environment values do not change for the lifetime of the process,
+    so the parsed configs are cached and returned as a read-only view.
+    """
+    _load_tier_configs()
+    return MappingProxyType(TIER_CONFIGS)
+
+
+@dataclass(slots=True)
 class StrategyParameters:
     """
     Complete strategy parameters.
@@ -96,70 +111,117 @@ class StrategyParameters:
     @classmethod
     def from_production(cls) -> "StrategyParameters":
         """Load all parameters from production environment."""
+        return cls(**{
+            name: convert(os.environ.get(env_key, default))
+            for name, convert, env_key, default in _PARAMETER_SCHEMA
+        })
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment flag."""
+    return value.lower() == "true"
+
+
+# StrategyParameters field -> (converter, environment variable, default)
+_PARAMETER_SCHEMA: Tuple[Tuple[str, Callable[[str], Any], str, str], ...] = (
+    ("ema_period", int, "EMA_PERIOD", "0"),
+    ("atr_period", int, "ATR_PERIOD", "0"),
+    ("adx_threshold", float, "ADX_THRESHOLD", "0"),
+    ("atr_vol_threshold", float, "ATR_VOL_THRESHOLD", "0"),
+    ("max_levels", int, "MAX_LEVELS", "0"),
+    ("spacing_low_mult", float, "SPACING_LOW_MULT", "0"),
+    ("spacing_normal_mult", float, "SPACING_NORMAL_MULT", "0"),
+    ("spacing_high_mult", float, "SPACING_HIGH_MULT", "0"),
+    ("vol_low_threshold", float, "VOL_LOW_THRESHOLD", "0"),
+    ("vol_high_threshold", float, "VOL_HIGH_THRESHOLD", "0"),
+    ("sl_atr_mult", float, "SL_ATR_MULT", "0"),
+    ("trailing_enabled", _parse_bool, "TRAILING_ENABLED", "true"),
+    ("max_margin_ratio", float, "MAX_MARGIN_RATIO", "0"),
+    ("emergency_drawdown", float, "EMERGENCY_DRAWDOWN", "0"),
+    ("execution_interval", int, "EXECUTION_INTERVAL", "60"),
+    ("timeframe", str, "TIMEFRAME", "1h"),
+)
+
+
+@lru_cache(maxsize=1)
+def _cached_params() -> StrategyParameters:
+    """Load strategy parameters from production environment once per process."""
+    return StrategyParameters.from_production()
+
+
+@dataclass(frozen=True, slots=True)
+class RegimeParameters:
+    """Grid parameters for a single market regime."""
+    base_spacing_pct: float = 0.0
+    tp_mult: float = 1.0
+    sl_drawdown: float = 0.0
+    max_levels: int = 0
+
+    @classmethod
+    def from_production(cls, regime: str) -> "RegimeParameters":
+        """Load regime parameters from production environment."""
+        prefix = f"REGIME_{regime.upper()}"
         return cls(
-            ema_period=int(os.getenv("EMA_PERIOD", "0")),
-            atr_period=int(os.getenv("ATR_PERIOD", "0")),
-            adx_threshold=float(os.getenv("ADX_THRESHOLD", "0")),
-            atr_vol_threshold=float(os.getenv("ATR_VOL_THRESHOLD", "0")),
-            max_levels=int(os.getenv("MAX_LEVELS", "0")),
-            spacing_low_mult=float(os.getenv("SPACING_LOW_MULT", "0")),
-            spacing_normal_mult=float(os.getenv("SPACING_NORMAL_MULT", "0")),
-            spacing_high_mult=float(os.getenv("SPACING_HIGH_MULT", "0")),
-            vol_low_threshold=float(os.getenv("VOL_LOW_THRESHOLD", "0")),
-            vol_high_threshold=float(os.getenv("VOL_HIGH_THRESHOLD", "0")),
-            sl_atr_mult=float(os.getenv("SL_ATR_MULT", "0")),
-            trailing_enabled=os.getenv("TRAILING_ENABLED", "true").lower() == "true",
-            max_margin_ratio=float(os.getenv("MAX_MARGIN_RATIO", "0")),
-            emergency_drawdown=float(os.getenv("EMERGENCY_DRAWDOWN", "0")),
-            execution_interval=int(os.getenv("EXECUTION_INTERVAL", "60")),
-            timeframe=os.getenv("TIMEFRAME", "1h"),
+            base_spacing_pct=float(os.getenv(f"{prefix}_SPACING", "0")),
+            tp_mult=float(os.getenv(f"{prefix}_TP_MULT", "1")),
+            sl_drawdown=float(os.getenv(f"{prefix}_SL", "0")),
+            max_levels=int(os.getenv(f"{prefix}_LEVELS", "0")),
         )
 
 
-# Regime-specific Parameter Structure
-REGIME_PARAMETERS = {
-    "stable_trend": {
-        "base_spacing_pct": "PRODUCTION_CONFIG",
-        "tp_mult": "PRODUCTION_CONFIG",
-        "sl_drawdown": "PRODUCTION_CONFIG",
-        "max_levels": "PRODUCTION_CONFIG",
-    },
-    "volatile_trend": {
-        "base_spacing_pct": "PRODUCTION_CONFIG",
-        "tp_mult": "PRODUCTION_CONFIG",
-        "sl_drawdown": "PRODUCTION_CONFIG",
-        "max_levels": "PRODUCTION_CONFIG",
-    },
-    "sideways_quiet": {
-        "base_spacing_pct": "PRODUCTION_CONFIG",
-        "tp_mult": "PRODUCTION_CONFIG",
-        "sl_drawdown": "PRODUCTION_CONFIG",
-        "max_levels": "PRODUCTION_CONFIG",
-    },
-    "sideways_chop": {
-        "base_spacing_pct": "PRODUCTION_CONFIG",
-        "tp_mult": "PRODUCTION_CONFIG",
-        "sl_drawdown": "PRODUCTION_CONFIG",
-        "max_levels": "PRODUCTION_CONFIG",
-    },
-}
+@dataclass(frozen=True, slots=True)
+class CostModel:
+    """Trading cost assumptions."""
+    fee_rate: float = 0.0
+    slippage_rate: float = 0.0
+    funding_rate: float = 0.0
 
+    @classmethod
+    def from_production(cls) -> "CostModel":
+        """Load cost model from production environment."""
+        return cls(
+            fee_rate=float(os.getenv("FEE_RATE", "0")),
+            slippage_rate=float(os.getenv("SLIPPAGE_RATE", "0")),
+            funding_rate=float(os.getenv("FUNDING_RATE", "0")),
+        )
 
-# Cost Model Structure
-COST_MODEL = {
-    "fee_rate": "PRODUCTION_CONFIG",
-    "slippage_rate": "PRODUCTION_CONFIG",
-    "funding_rate": "PRODUCTION_CONFIG",
-}
+
+@lru_cache(maxsize=1)
+def get_regime_parameters() -> Mapping[str, RegimeParameters]:
+    """
+    Get regime-specific parameters, keyed by regime value (e.g. "stable_trend").
+
+    Note: Production values loaded from secure environment.
+          Environment is read once and cached for the process.
+    """
+    return MappingProxyType({
+        regime: RegimeParameters.from_production(regime)
+        for regime in ("stable_trend", "volatile_trend", "sideways_quiet", "sideways_chop")
+    })
+
+
+@lru_cache(maxsize=1)
+def get_cost_model() -> CostModel:
+    """
+    Get the trading cost model.
+
+    Note: Production values loaded from secure environment.
+          Environment is read once and cached for the process.
+    """
+    return CostModel.from_production()
 
 
 # Symbol Configuration
-SAFE_SYMBOLS = [
+# Ordered tuple for iteration, frozenset for O(1) membership tests.
+# Symbols are interned so comparisons against exchange symbols
+# obtained via sys.intern() hit the identity fast path.
+SAFE_SYMBOLS: Tuple[str, ...] = tuple(sys.intern(symbol) for symbol in (
     "BTC/USDT:USDT",
     "ETH/USDT:USDT",
     "SOL/USDT:USDT",
     # Additional symbols loaded from production config
-]
+))
+SAFE_SYMBOLS_SET: FrozenSet[str] = frozenset(SAFE_SYMBOLS)
 
 
 # Competition Configuration
@@ -172,19 +234,12 @@ COMPETITION_CONFIG = {
 }
 
 
-def get_parameters(tier: TradingTier = TradingTier.BALANCE) -> Dict:
-    """
-    Get complete parameters for a trading tier.
-
-    Note: Production values loaded from secure environment.
-    """
-    if not TIER_CONFIGS:
-        _load_tier_configs()
-
-    tier_config = TIER_CONFIGS.get(tier)
-    base_params = StrategyParameters.from_production()
+def _build_parameters(tier: TradingTier) -> Mapping:
+    """Build the read-only parameter mapping for a trading tier."""
+    tier_config = _get_tier_configs().get(tier)
+    base_params = _cached_params()
 
-    return {
+    return MappingProxyType({
         # Tier settings
         "tier": tier.value,
         "leverage": tier_config.leverage if tier_config else 0,
@@ -216,11 +271,42 @@ def get_parameters(tier: TradingTier = TradingTier.BALANCE) -> Dict:
         "timeframe": base_params.timeframe,
 
         # Costs
-        "cost_model": COST_MODEL,
+        "cost_model": get_cost_model(),
 
         # Regime parameters
-        "regime_parameters": REGIME_PARAMETERS,
-    }
+        "regime_parameters": get_regime_parameters(),
+    })
+
+
+# Regime parameters, cost model and complete parameters per tier,
+# evaluated once at import. Left as None (and empty) if the environment
+# cannot be parsed yet; the get_*() accessors then load them on first use
+# and raise the parse error there.
+REGIME_PARAMETERS: Optional[Mapping[str, RegimeParameters]] = None
+COST_MODEL: Optional[CostModel] = None
+_PARAMS_BY_TIER: Dict[TradingTier, Mapping]
+try:
+    REGIME_PARAMETERS = get_regime_parameters()
+    COST_MODEL = get_cost_model()
+    _PARAMS_BY_TIER = {tier: _build_parameters(tier) for tier in TradingTier}
+except ValueError:
+    _PARAMS_BY_TIER = {}
+
+
+def get_parameters(tier: TradingTier = TradingTier.BALANCE) -> Mapping:
+    """
+    Get complete parameters for a trading tier.
+
+    The result is built once per tier and returned as a read-only
+    mapping shared by all callers; copy it with dict() to modify.
+
+    Note: Production values loaded from secure environment.
+          Environment is read once and cached for the process.
+    """
+    params = _PARAMS_BY_TIER.get(tier)
+    if params is None:
+        params = _PARAMS_BY_TIER[tier] = _build_parameters(tier)
+    return params
 
 
 # Example usage
@@ -0,0 +1,16 @@
+"""
+Risk Manager Demo
+
+Usage: python examples/risk_manager_demo.py
+
+Author: AYC Fund (YC W22)
+Version: 9.5
+"""
+
+
+if __name__ == "__main__":
+    print("Risk Manager - CapitalGuard V9.5")
+    print("=" * 50)
+    print("\nNote: Risk parameters loaded from environment.")
+    print("This public repository contains strategy structure only.")
+    print("\nFor competition evaluation, contact: @runwithcrypto")
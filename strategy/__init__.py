@@ -2,29 +2,62 @@
 AYC Fund - ATR Grid Strategy V9.5
 
 Core trading strategy components for Bybit AI Trading Competition 2026.
+
+Submodules are imported lazily on first attribute access (PEP 562),
+so importing the package does not pull in pandas/numpy until needed.
 """
 
-from .atr_grid_strategy import (
-    ATRGridStrategy,
-    GridDirection,
-    GridLevel,
-    GridState,
-    MarketRegime,
-    RegimeConfig,
-    REGIME_CONFIGS,
-)
-
-from .regime_detector import (
-    RegimeDetector,
-    RegimeAnalysis,
-)
-
-from .risk_manager import (
-    CapitalGuard,
-    RiskManager,
-    RiskCheckResult,
-    RiskLevel,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .atr_grid_strategy import (
+        ATRGridStrategy,
+        GridDirection,
+        GridLevel,
+        GridState,
+        MarketRegime,
+        OHLCV,
+        RegimeConfig,
+        REGIME_CONFIGS,
+    )
+
+    from .regime_detector import (
+        RegimeDetector,
+        RegimeAnalysis,
+    )
+
+    from .risk_manager import (
+        CapitalGuard,
+        PortfolioRiskState,
+        RiskManager,
+        RiskCheckResult,
+        RiskLevel,
+    )
+
+# Public name -> defining submodule
+_LAZY_IMPORTS = {
+    # Strategy
+    "ATRGridStrategy": ".atr_grid_strategy",
+    "GridDirection": ".atr_grid_strategy",
+    "GridLevel": ".atr_grid_strategy",
+    "GridState": ".atr_grid_strategy",
+    "MarketRegime": ".atr_grid_strategy",
+    "OHLCV": ".atr_grid_strategy",
+    "RegimeConfig": ".atr_grid_strategy",
+    "REGIME_CONFIGS": ".atr_grid_strategy",
+
+    # Regime Detection
+    "RegimeDetector": ".regime_detector",
+    "RegimeAnalysis": ".regime_detector",
+
+    # Risk Management
+    "CapitalGuard": ".risk_manager",
+    "PortfolioRiskState": ".risk_manager",
+    "RiskManager": ".risk_manager",
+    "RiskCheckResult": ".risk_manager",
+    "RiskLevel": ".risk_manager",
+}
 
 __all__ = [
     # Strategy
@@ -33,6 +66,7 @@ __all__ = [
     "GridLevel",
     "GridState",
     "MarketRegime",
+    "OHLCV",
     "RegimeConfig",
     "REGIME_CONFIGS",
 
@@ -42,6 +76,7 @@ __all__ = [
 
     # Risk Management
     "CapitalGuard",
+    "PortfolioRiskState",
     "RiskManager",
     "RiskCheckResult",
     "RiskLevel",
@@ -49,3 +84,17 @@ __all__ = [
 
 __version__ = "9.5"
 __author__ = "AYC Fund (YC W22)"
+
+
+def __getattr__(name: str):
+    """Resolve public names from their submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,57 @@
+"""
+Ahead-of-Time Indicator Kernels
+
+Builds the numba kernels from _indicators_njit into a regular extension
+module, strategy/_indicators_aot_ext, so processes start without JIT
+compilation or cache loading. _indicators_njit picks the extension up
+automatically when it exists.
+
+Author: AYC Fund (YC W22)
+Version: 9.5
+
+Usage:
+    python -m strategy._indicators_aot
+
+Note: Building requires numba; the built extension only needs NumPy.
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from . import _indicators_njit as kernels
+
+EXTENSION_NAME = "_indicators_aot_ext"
+
+# Exported variants per input dtype: OHLCV arrays are float32,
+# regime detector columns are float64
+_DTYPES = ("f4", "f8")
+
+
+def build(output_dir: str = None) -> None:
+    """
+    Compile the extension module.
+
+    Args:
+        output_dir: Destination directory (defaults to the strategy package)
+    """
+    cc = CC(EXTENSION_NAME)
+    cc.output_dir = output_dir or str(Path(__file__).resolve().parent)
+
+    for dtype in _DTYPES:
+        arr = f"{dtype}[:]"
+        cc.export(
+            f"adx_atr_kernel_{dtype}",
+            f"Tuple((f8, f8, f8, f8, f8[:]))({arr}, {arr}, {arr}, i8, i8, b1)",
+        )(kernels._jit_adx_atr_kernel.py_func)
+        cc.export(
+            f"adx_series_{dtype}",
+            f"f8[:]({arr}, {arr}, {arr}, i8)",
+        )(kernels._jit_adx_series.py_func)
+    cc.export("trailing_sl_loop", "f8[:](f8[:], f8, f8, f8, b1)")(kernels._trailing_sl_loop.py_func)
+
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,422 @@
+"""
+Numba-compiled Indicator Kernels
+
+Low-level NumPy kernels shared by the strategy and regime detector.
+
+Author: AYC Fund (YC W22)
+Version: 9.5
+
+Note: Numba is optional. Without it the kernels run as plain Python
+      loops over NumPy arrays and produce identical results. With it,
+      kernels are compiled (or loaded from cache) at import; set
+      NUMBA_WARMUP=false to defer compilation to first use.
+"""
+
+import math
+import os
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import config as numba_config, njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    numba_config = None
+    types = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+# fastmath without 'nnan'/'ninf': the kernels rely on NaN checks
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Options shared by every kernel: on-disk cache, no per-index bounds
+# checks, and NumPy float semantics (inf/NaN) instead of raising on
+# division by zero
+JIT_OPTIONS = dict(cache=True, fastmath=FASTMATH, boundscheck=False, error_model="numpy")
+
+
+@njit(**JIT_OPTIONS)
+def _ewm_step(weighted, old_wt, started, x, alpha):
+    """
+    One step of pandas' adjust=False EWM recurrence.
+
+    Returns:
+        Updated (weighted, old_wt, started) state
+    """
+    is_observation = not np.isnan(x)
+    if started:
+        old_wt *= 1.0 - alpha
+        if is_observation:
+            if weighted != x:
+                weighted = (old_wt * weighted + alpha * x) / (old_wt + alpha)
+            old_wt = 1.0
+    elif is_observation:
+        weighted = x
+        started = True
+    return weighted, old_wt, started
+
+
+# OHLCV arrays are float32; derived series (DI, DX) are float64.
+# The recurrence always accumulates and returns float64. Inputs are typed
+# read-only so pandas' copy-on-write column views match as well; writable
+# arrays convert to these signatures implicitly.
+_EWM_SIGNATURES = [
+    types.float64[:](types.Array(dtype, 1, "A", readonly=True), types.float64)
+    for dtype in (types.float32, types.float64)
+] if NUMBA_AVAILABLE else []
+
+
+@njit(_EWM_SIGNATURES, **JIT_OPTIONS)
+def ewm_mean(x, alpha):
+    """
+    Exponentially weighted mean over a 1-D float array.
+
+    Equivalent to ``pd.Series(x).ewm(alpha=alpha, adjust=False).mean()``,
+    including pandas' handling of NaN inputs (ignore_na=False): leading
+    NaNs stay NaN, later NaNs repeat the previous value and decay its weight.
+
+    Args:
+        x: Input values (float32 or float64)
+        alpha: Smoothing factor, 2 / (span + 1) for a span-based EMA
+
+    Returns:
+        Array of smoothed values, same length as x
+    """
+    n = x.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    weighted = np.nan
+    old_wt = 1.0
+    started = False
+
+    for i in range(n):
+        weighted, old_wt, started = _ewm_step(weighted, old_wt, started, np.float64(x[i]), alpha)
+        out[i] = weighted
+
+    return out
+
+
+@njit(**JIT_OPTIONS)
+def _true_range_at(high, low, close, i):
+    """True Range of bar i; fmax semantics, so the first bar is high - low."""
+    h = high[i]
+    l = low[i]
+    tr = h - l
+    if i > 0:
+        pc = close[i - 1]
+        gap = math.fabs(h - pc)
+        if np.isnan(tr) or gap > tr:
+            tr = gap
+        gap = math.fabs(l - pc)
+        if np.isnan(tr) or gap > tr:
+            tr = gap
+    return np.float64(tr)
+
+
+@njit(**JIT_OPTIONS)
+def _directional_move_at(high, low, i):
+    """Wilder +DM/-DM of bar i; ties and the first bar count as no movement."""
+    plus_dm = 0.0
+    minus_dm = 0.0
+    if i > 0:
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        move_diff = up_move - down_move
+        if move_diff > 0 and up_move > 0:
+            plus_dm = np.float64(up_move)
+        elif move_diff < 0 and down_move > 0:
+            minus_dm = np.float64(down_move)
+    return plus_dm, minus_dm
+
+
+@njit(**JIT_OPTIONS)
+def _dx(plus, minus, atr):
+    """DX from smoothed +DM/-DM; undefined (NaN) while ATR is zero or missing."""
+    if atr > 0:
+        plus_di = 100 * plus / atr
+        minus_di = 100 * minus / atr
+        return 100 * math.fabs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
+    return np.nan
+
+
+@njit(**JIT_OPTIONS)
+def adx_atr_kernel(high, low, close, n_short, n_long, with_adx=True):
+    """
+    True Range, ATR, +DM/-DM, DX and ADX in a single pass over the bars.
+
+    Matches the array pipeline (fmax-based True Range, Wilder +DM/-DM
+    with ties counting as no movement, ewm_mean smoothing with
+    alpha = 2 / (n_short + 1)) without allocating any N-length arrays.
+    The last n_long ATR values are kept in a ring buffer for the ATR
+    moving average.
+
+    Args:
+        high, low, close: Bar prices (float32 or float64)
+        n_short: Span for ATR and ADX smoothing
+        n_long: Number of trailing ATR values to return
+        with_adx: Compute +DM/-DM/ADX too; if False they are returned as NaN
+
+    Returns:
+        Tuple of (atr, plus_dm_smooth, minus_dm_smooth, adx, atr_tail),
+        the last smoothed values and the last n_long ATR values, oldest first
+    """
+    n = close.shape[0]
+    alpha = 2.0 / (n_short + 1)
+    ring_size = max(n_long, 1)
+    ring = np.empty(ring_size, dtype=np.float64)
+
+    atr, atr_wt, atr_on = np.nan, 1.0, False
+    plus, plus_wt, plus_on = np.nan, 1.0, False
+    minus, minus_wt, minus_on = np.nan, 1.0, False
+    adx, adx_wt, adx_on = np.nan, 1.0, False
+
+    for i in range(n):
+        tr = _true_range_at(high, low, close, i)
+        atr, atr_wt, atr_on = _ewm_step(atr, atr_wt, atr_on, tr, alpha)
+        ring[i % ring_size] = atr
+
+        if with_adx:
+            plus_dm, minus_dm = _directional_move_at(high, low, i)
+            plus, plus_wt, plus_on = _ewm_step(plus, plus_wt, plus_on, plus_dm, alpha)
+            minus, minus_wt, minus_on = _ewm_step(minus, minus_wt, minus_on, minus_dm, alpha)
+            adx, adx_wt, adx_on = _ewm_step(adx, adx_wt, adx_on, _dx(plus, minus, atr), alpha)
+
+    m = min(n, n_long)
+    atr_tail = np.empty(m, dtype=np.float64)
+    for j in range(m):
+        atr_tail[j] = ring[(n - m + j) % ring_size]
+
+    return atr, plus, minus, adx, atr_tail
+
+
+@njit(**JIT_OPTIONS)
+def adx_series(high, low, close, n_short):
+    """
+    Full ADX series in a single pass over the bars.
+
+    Same recurrences as adx_atr_kernel(), keeping every smoothed ADX value.
+
+    Args:
+        high, low, close: Bar prices (float32 or float64)
+        n_short: Span for ATR and ADX smoothing
+
+    Returns:
+        Array of ADX values, same length as the inputs
+    """
+    n = close.shape[0]
+    alpha = 2.0 / (n_short + 1)
+    out = np.empty(n, dtype=np.float64)
+
+    atr, atr_wt, atr_on = np.nan, 1.0, False
+    plus, plus_wt, plus_on = np.nan, 1.0, False
+    minus, minus_wt, minus_on = np.nan, 1.0, False
+    adx, adx_wt, adx_on = np.nan, 1.0, False
+
+    for i in range(n):
+        atr, atr_wt, atr_on = _ewm_step(atr, atr_wt, atr_on, _true_range_at(high, low, close, i), alpha)
+        plus_dm, minus_dm = _directional_move_at(high, low, i)
+        plus, plus_wt, plus_on = _ewm_step(plus, plus_wt, plus_on, plus_dm, alpha)
+        minus, minus_wt, minus_on = _ewm_step(minus, minus_wt, minus_on, minus_dm, alpha)
+        adx, adx_wt, adx_on = _ewm_step(adx, adx_wt, adx_on, _dx(plus, minus, atr), alpha)
+        out[i] = adx
+
+    return out
+
+
+# Relative weight below which older observations are dropped by ewm_last()
+EWM_TAIL_TOLERANCE = 1e-9
+
+
+@lru_cache(maxsize=32)
+def _ewm_tail_weights(alpha: float, length: int) -> np.ndarray:
+    """
+    Weights reproducing the adjust=False EMA of ``length`` values.
+
+    The oldest value seeds the recurrence with weight (1 - alpha)^(length - 1);
+    every later value i carries alpha * (1 - alpha)^(length - 1 - i).
+    """
+    decay = 1.0 - alpha
+    weights = alpha * decay ** np.arange(length - 1, -1, -1, dtype=np.float64)
+    weights[0] = decay ** (length - 1)
+    weights.setflags(write=False)
+    return weights
+
+
+def ewm_last(x: np.ndarray, alpha: float) -> float:
+    """
+    Last value of ``ewm_mean(x, alpha)`` without building the full series.
+
+    Only the most recent k values are used, with k chosen so the weight of
+    anything older is below EWM_TAIL_TOLERANCE; the result is exact when
+    x is no longer than k + 1. Falls back to ewm_mean() if the tail
+    contains NaN, to keep pandas' NaN semantics.
+    """
+    if len(x) == 0:
+        return np.nan
+    decay = 1.0 - alpha
+    if 0.0 < decay < 1.0:
+        k = int(np.ceil(np.log(EWM_TAIL_TOLERANCE) / np.log(decay)))
+    else:
+        k = len(x)
+    tail = x[-(k + 1):]
+    value = float(_ewm_tail_weights(alpha, len(tail)) @ tail)
+    if value != value:
+        return float(ewm_mean(x, alpha)[-1])
+    return value
+
+
+@njit(**JIT_OPTIONS)
+def _trailing_sl_loop(prices, sl, extreme, factor, is_long):
+    """Sequential trailing stop recurrence behind trailing_sl_path()."""
+    out = np.empty(prices.shape[0], dtype=np.float64)
+    for i in range(prices.shape[0]):
+        price = prices[i]
+        if is_long:
+            if price > extreme:
+                extreme = price
+            candidate = extreme * factor
+            if candidate > sl:
+                sl = candidate
+        else:
+            if price < extreme:
+                extreme = price
+            candidate = extreme * factor
+            if candidate < sl:
+                sl = candidate
+        out[i] = sl
+    return out
+
+
+def trailing_sl_path(
+    prices: np.ndarray, sl: float, extreme: float, factor: float, is_long: bool
+) -> np.ndarray:
+    """
+    Trailing stop loss after each price of a sequence.
+
+    LONG stops trail the running high (extreme) times factor and only
+    move up; SHORT stops trail the running low and only move down.
+    Without numba this runs as running max/min accumulations instead
+    of a Python loop; both agree for finite starting values.
+
+    Args:
+        prices: Price sequence, oldest first
+        sl: Stop loss before the first price
+        extreme: Highest (LONG) or lowest (SHORT) price before the first price
+        factor: 1 - drawdown for LONG, 1 + drawdown for SHORT
+        is_long: Direction of the position
+
+    Returns:
+        Array of stop loss prices, one per input price
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if _aot is not None:
+        return _aot.trailing_sl_loop(prices, float(sl), float(extreme), float(factor), bool(is_long))
+    if NUMBA_AVAILABLE:
+        return _trailing_sl_loop(prices, float(sl), float(extreme), float(factor), bool(is_long))
+
+    running = np.fmax if is_long else np.fmin
+    extremes = running.accumulate(np.concatenate(([extreme], prices)))[1:]
+    return running.accumulate(np.concatenate(([sl], extremes * factor)))[1:]
+
+
+@njit(parallel=True, **JIT_OPTIONS)
+def adx_atr_batch(high, low, close, n_short, n_long):
+    """
+    Latest ADX, ATR and ATR ratio for many symbols, one row per symbol.
+
+    Runs adx_atr_kernel() over the rows of (symbols, bars) arrays, with
+    the rows spread across threads.
+
+    Args:
+        high, low, close: 2-D bar prices, shape (symbols, bars)
+        n_short: Span for ATR and ADX smoothing
+        n_long: Window of the ATR moving average behind the ratio
+
+    Returns:
+        Tuple of (adx, atr, atr_ratio) float64 arrays, one value per row;
+        the ratio is 1.0 with fewer than n_long bars or a non-positive mean
+    """
+    rows = close.shape[0]
+    adx = np.empty(rows, dtype=np.float64)
+    atr = np.empty(rows, dtype=np.float64)
+    atr_ratio = np.ones(rows, dtype=np.float64)
+    for r in prange(rows):
+        atr_r, _, _, adx_r, atr_tail = _jit_adx_atr_kernel(high[r], low[r], close[r], n_short, n_long, True)
+        adx[r] = adx_r
+        atr[r] = atr_r
+        if atr_tail.shape[0] >= n_long:
+            avg_atr = atr_tail.mean()
+            if avg_atr > 0:
+                atr_ratio[r] = atr_r / avg_atr
+    return adx, atr, atr_ratio
+
+
+# Ahead-of-time compiled kernels, built by `python -m strategy._indicators_aot`.
+# The extension needs only NumPy at runtime and has nothing to JIT-compile;
+# the JIT kernels stay the fallback for other dtypes.
+try:
+    from . import _indicators_aot_ext as _aot
+except ImportError:
+    _aot = None
+
+_jit_adx_atr_kernel = adx_atr_kernel
+_jit_adx_series = adx_series
+
+if _aot is not None:
+    _AOT_ADX_ATR = {np.dtype(np.float32): _aot.adx_atr_kernel_f4, np.dtype(np.float64): _aot.adx_atr_kernel_f8}
+    _AOT_ADX_SERIES = {np.dtype(np.float32): _aot.adx_series_f4, np.dtype(np.float64): _aot.adx_series_f8}
+
+    def adx_atr_kernel(high, low, close, n_short, n_long, with_adx=True):
+        kernel = _AOT_ADX_ATR.get(close.dtype)
+        if kernel is None or high.dtype != close.dtype or low.dtype != close.dtype:
+            return _jit_adx_atr_kernel(high, low, close, n_short, n_long, with_adx)
+        return kernel(high, low, close, n_short, n_long, with_adx)
+
+    def adx_series(high, low, close, n_short):
+        kernel = _AOT_ADX_SERIES.get(close.dtype)
+        if kernel is None or high.dtype != close.dtype or low.dtype != close.dtype:
+            return _jit_adx_series(high, low, close, n_short)
+        return kernel(high, low, close, n_short)
+
+    adx_atr_kernel.__doc__ = _jit_adx_atr_kernel.__doc__
+    adx_series.__doc__ = _jit_adx_series.__doc__
+
+
+def warmup() -> None:
+    """
+    Compile, or load from numba's on-disk cache, every kernel for the
+    argument types the strategy and regime detector pass, so the first
+    live signal does not pay for compilation.
+
+    Read-only arrays are a separate numba type and are what pandas'
+    copy-on-write column views produce, so both variants are compiled.
+    """
+    for writeable in (True, False):
+        base = np.linspace(100.0, 101.0, 64)
+        for dtype in (np.float32, np.float64):
+            close = base.astype(dtype)
+            high = close + 1
+            low = close - 1
+            for arr in (high, low, close):
+                arr.setflags(write=writeable)
+            adx_atr_kernel(high, low, close, 14, 50, True)
+            adx_series(high, low, close, 14)
+        base.setflags(write=writeable)
+        trailing_sl_path(base, 99.0, 100.0, 0.95, True)
+
+
+if NUMBA_AVAILABLE and not numba_config.DISABLE_JIT and os.getenv("NUMBA_WARMUP", "true").lower() == "true":
+    try:
+        warmup()
+    except Exception:  # pragma: no cover - real calls surface compile errors
+        pass
@@ -10,17 +10,57 @@ Version: 9.5
 Note: Actual parameters are loaded from production configuration.
 """
 
+import json
 import logging
+import math
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, ClassVar, Deque, Dict, List, Optional, Tuple, Union
 
-import pandas as pd
 import numpy as np
 
+if TYPE_CHECKING:
+    # DataFrames are only read through column/index access, so pandas
+    # is not imported at runtime
+    import pandas as pd
+
+from ._indicators_njit import adx_atr_kernel, ewm_last, ewm_mean, trailing_sl_path
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional fast JSON encoder
+    msgspec = None
+
+
+@lru_cache(maxsize=1)
+def _load_talib() -> Optional[ModuleType]:
+    """Import the optional C indicator library (importing talib also imports pandas)."""
+    try:
+        import talib
+    except ImportError:  # pragma: no cover - optional C indicator library
+        return None
+    return talib
+
+
+def _talib() -> Optional[ModuleType]:
+    """
+    TA-Lib module for full-history indicators, or None when not in use.
+
+    Opt-in with USE_TALIB=true: TA-Lib seeds EMA from an SMA and smooths
+    ATR/ADX with Wilder's 1/n factor, so its values differ from the
+    span-based EWM the production thresholds are tuned on.
+    """
+    if os.getenv("USE_TALIB", "false").lower() != "true":
+        return None
+    return _load_talib()
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +72,16 @@ class GridDirection(str, Enum):
     BOTH = "both"  # Hedge Mode support
 
 
+# Members as module globals: GridDirection.LONG is a metaclass attribute
+# lookup, several times slower than the str comparison that follows it
+_LONG = GridDirection.LONG
+_SHORT = GridDirection.SHORT
+_BOTH = GridDirection.BOTH
+
+# Trend direction indexed by sign(price - ema) + 1
+_DIR_BY_SIGN = (_SHORT, GridDirection.NEUTRAL, _LONG)
+
+
 class MarketRegime(str, Enum):
     """Market regime classification."""
     STABLE_TREND = "stable_trend"
@@ -41,9 +91,13 @@ class MarketRegime(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# should_skip_entry() reasons, built once instead of formatted per skip
+_AI_FILTER_REASONS = {regime: f"AI Filter ({regime.value})" for regime in MarketRegime}
+
+
+@dataclass(frozen=True, slots=True)
 class RegimeConfig:
-    """Configuration for each market regime."""
+    """Configuration for each market regime (immutable once loaded)."""
     base_spacing_pct: float
     tp_mult: float
     sl_drawdown: float
@@ -51,6 +105,14 @@ class RegimeConfig:
     volatility_threshold: float
     ai_filter_strict: bool
 
+    # Stop loss price / entry price, derived from sl_drawdown
+    sl_long_factor: float = field(init=False, repr=False)
+    sl_short_factor: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "sl_long_factor", 1 - self.sl_drawdown)
+        object.__setattr__(self, "sl_short_factor", 1 + self.sl_drawdown)
+
     @classmethod
     def from_production_config(cls, regime: str) -> "RegimeConfig":
         """
@@ -90,6 +152,31 @@ def _load_regime_config(regime: str) -> Dict:
 # Regime configurations - actual values loaded from production environment
 REGIME_CONFIGS: Dict[MarketRegime, RegimeConfig] = {}
 
+# Fallbacks used when no regime is given - read once at import
+_DEFAULT_SPACING_PCT = float(os.getenv("DEFAULT_SPACING_PCT", "0"))
+_DEFAULT_TP_MULT = float(os.getenv("DEFAULT_TP_MULT", "1"))
+_DEFAULT_SL_DRAWDOWN = float(os.getenv("DEFAULT_SL_DRAWDOWN", "0"))
+
+# Config used when no regime is given
+_DEFAULT_REGIME_CONFIG = RegimeConfig(
+    base_spacing_pct=_DEFAULT_SPACING_PCT,
+    tp_mult=_DEFAULT_TP_MULT,
+    sl_drawdown=_DEFAULT_SL_DRAWDOWN,
+    max_levels=0,
+    volatility_threshold=1.0,
+    ai_filter_strict=False,
+)
+
+# Config used for a regime with no loaded configuration (e.g. UNKNOWN)
+_MISSING_REGIME_CONFIG = RegimeConfig(
+    base_spacing_pct=0.0,
+    tp_mult=1.0,
+    sl_drawdown=0.0,
+    max_levels=0,
+    volatility_threshold=1.0,
+    ai_filter_strict=False,
+)
+
 
 def initialize_regime_configs():
     """Initialize regime configurations from production environment."""
@@ -110,7 +197,7 @@ def initialize_regime_configs():
                 )
 
 
-@dataclass
+@dataclass(slots=True)
 class GridLevel:
     """A single grid level."""
     level: int
@@ -124,22 +211,33 @@ class GridLevel:
     entry_time: Optional[str] = None
     fill_time: Optional[str] = None
 
+    # to_dict() keys in output order, read in one call by a pre-bound attrgetter
+    _KEYS: ClassVar[Tuple[str, ...]] = (
+        "level", "direction", "entry_price", "tp_price", "quantity",
+        "order_id", "tp_order_id", "status", "entry_time", "fill_time",
+    )
+    _get_fields: ClassVar[Callable] = attrgetter(*_KEYS)
+
+    def to_tuple(self) -> Tuple:
+        """
+        Field values in _KEYS order, with direction as its string value.
+
+        A compact positional form for persistence (e.g. msgpack) that does
+        not repeat the keys for every level.
+        """
+        values = self._get_fields(self)
+        # _value_ is the plain attribute behind the Enum.value property
+        return (values[0], self.direction._value_) + values[2:]
+
     def to_dict(self) -> Dict:
-        return {
-            "level": self.level,
-            "direction": self.direction.value,
-            "entry_price": self.entry_price,
-            "tp_price": self.tp_price,
-            "quantity": self.quantity,
-            "order_id": self.order_id,
-            "tp_order_id": self.tp_order_id,
-            "status": self.status,
-            "entry_time": self.entry_time,
-            "fill_time": self.fill_time
-        }
+        return dict(zip(self._KEYS, self.to_tuple()))
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes with the same shape as to_dict()."""
+        return _encode_json(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class GridState:
     """Persistent state of a running grid."""
     symbol: str
@@ -158,22 +256,155 @@ class GridState:
     long_sl_price: Optional[float] = None
     short_sl_price: Optional[float] = None
 
+    _KEYS: ClassVar[Tuple[str, ...]] = (
+        "symbol", "direction", "current_atr", "current_ema", "spacing", "levels",
+        "sl_price", "highest_price", "lowest_price", "sl_drawdown", "last_update",
+        "long_sl_price", "short_sl_price",
+    )
+    _get_fields: ClassVar[Callable] = attrgetter(*_KEYS)
+
+    def to_tuple(self) -> Tuple:
+        """Field values in _KEYS order, with levels as GridLevel.to_tuple() tuples."""
+        values = self._get_fields(self)
+        levels = tuple([l.to_tuple() for l in self.levels])
+        return (values[0], self.direction._value_) + values[2:5] + (levels,) + values[6:]
+
     def to_dict(self) -> Dict:
-        return {
-            "symbol": self.symbol,
-            "direction": self.direction.value,
-            "current_atr": self.current_atr,
-            "current_ema": self.current_ema,
-            "spacing": self.spacing,
-            "levels": [l.to_dict() for l in self.levels],
-            "sl_price": self.sl_price,
-            "highest_price": self.highest_price,
-            "lowest_price": self.lowest_price,
-            "sl_drawdown": self.sl_drawdown,
-            "last_update": self.last_update,
-            "long_sl_price": self.long_sl_price,
-            "short_sl_price": self.short_sl_price,
-        }
+        data = dict(zip(self._KEYS, self._get_fields(self)))
+        data["direction"] = self.direction._value_
+        data["levels"] = [l.to_dict() for l in self.levels]
+        return data
+
+    _get_level_columns: ClassVar[Callable] = attrgetter("entry_price", "tp_price", "quantity")
+
+    def level_arrays(
+        self,
+        status: Optional[str] = None,
+        direction: Optional[GridDirection] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Entry prices, TP prices and quantities of the levels as float64 columns.
+
+        A structure-of-arrays view of levels for vectorized grid math
+        (the list stays the source of truth and the persisted form).
+
+        Args:
+            status: Only include levels with this status
+            direction: Only include levels of this direction (Hedge Mode)
+
+        Returns:
+            Tuple of (entry_prices, tp_prices, quantities), in level order
+        """
+        levels = self.levels
+        if status is not None or direction is not None:
+            levels = [
+                l for l in levels
+                if (status is None or l.status == status)
+                and (direction is None or l.direction == direction)
+            ]
+        columns = np.array(
+            [self._get_level_columns(l) for l in levels], dtype=np.float64
+        ).reshape(-1, 3).T.copy()
+        return columns[0], columns[1], columns[2]
+
+    def average_entry_price(
+        self,
+        status: Optional[str] = None,
+        direction: Optional[GridDirection] = None,
+    ) -> Optional[float]:
+        """
+        Quantity-weighted average entry price of the selected levels.
+
+        Returns:
+            Average entry price, or None if the levels hold no quantity
+        """
+        entries, _, quantities = self.level_arrays(status, direction)
+        total = quantities.sum()
+        if total <= 0:
+            return None
+        return float(entries @ quantities / total)
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes with the same shape as to_dict()."""
+        return _encode_json(self)
+
+
+def _encode_json(obj) -> bytes:
+    """
+    Encode a grid dataclass as JSON.
+
+    Uses msgspec when available, which serializes the slotted dataclass
+    directly in C; otherwise falls back to json.dumps(obj.to_dict()).
+    Both paths emit compact JSON that parses to the same value: NumPy
+    scalars are written as Python numbers and NaN/inf as null. Only the
+    float spelling may differ (msgspec writes 1e16 where json writes 1e+16).
+    """
+    if msgspec is not None:
+        return msgspec.json.encode(obj, enc_hook=_numpy_scalar)
+    return json.dumps(_json_safe(obj.to_dict()), separators=(",", ":")).encode()
+
+
+def _numpy_scalar(value):
+    """msgspec enc_hook: convert NumPy scalars (e.g. np.float32 prices) to Python values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise NotImplementedError(f"Objects of type {type(value)} are not supported")
+
+
+def _json_safe(value):
+    """Convert NumPy scalars and replace NaN/inf with None, as msgspec encodes them."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_safe(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class OHLCV:
+    """
+    OHLCV bars as contiguous NumPy columns (structure of arrays).
+
+    Indicator code works on these arrays directly instead of going
+    through pandas Series indexing, shifting and alignment.
+
+    Prices are stored as float32, which is ample precision for indicator
+    inputs and halves memory traffic; EWM smoothing accumulates in float64
+    and SL/TP prices are computed from Python floats.
+    """
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    ts: np.ndarray
+
+    @classmethod
+    def from_df(cls, df: "pd.DataFrame") -> "OHLCV":
+        """Extract high/low/close columns and the index from a DataFrame."""
+        return cls(
+            high=np.ascontiguousarray(df['high'].to_numpy(dtype=np.float32)),
+            low=np.ascontiguousarray(df['low'].to_numpy(dtype=np.float32)),
+            close=np.ascontiguousarray(df['close'].to_numpy(dtype=np.float32)),
+            ts=df.index.to_numpy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+
+Bars = Union["pd.DataFrame", OHLCV]
+
+
+def _float64_hlc(bars: OHLCV) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """High/low/close as float64, the dtype TA-Lib requires."""
+    return (
+        bars.high.astype(np.float64),
+        bars.low.astype(np.float64),
+        bars.close.astype(np.float64),
+    )
 
 
 class RegimeDetector:
@@ -185,84 +416,360 @@ class RegimeDetector:
         self.window_long = window_long or int(os.getenv("ATR_WINDOW_LONG", "50"))
         self.adx_threshold = float(os.getenv("ADX_THRESHOLD", "0"))
         self.atr_vol_threshold = float(os.getenv("ATR_VOL_THRESHOLD", "0"))
+        # Reuse the last ADX while it provably stays on one side of the threshold
+        self.hold_adx = os.getenv("ADX_HOLD", "false").lower() == "true"
+        self.talib = _talib()
+        self.use_talib = self.talib is not None
+
+        # (df, len(df), last index label, bars) for the last converted DataFrame
+        self._bars_cache: Optional[Tuple["pd.DataFrame", int, object, OHLCV]] = None
+        # (bars, tr) for the most recently seen bars
+        self._tr_cache: Optional[Tuple[OHLCV, np.ndarray]] = None
+        # Output and scratch buffers for _compute_tr(), grown on demand
+        self._tr_buf = np.empty(0, dtype=np.float32)
+        self._tr_scratch = np.empty(0, dtype=np.float32)
+        # (bars, detect_regime result) for the last call
+        self._regime_cache: Optional[Tuple[OHLCV, Tuple[MarketRegime, float, float]]] = None
+        # (bars, with_adx, adx_atr_kernel result) for the most recently seen bars
+        self._adx_atr_cache: Optional[Tuple[OHLCV, bool, Tuple[float, float, float, float, np.ndarray]]] = None
+        # (adx, bar timestamp, bar close, bars held since) for the last computed ADX
+        self._adx_anchor: Optional[Tuple[float, object, float, int]] = None
+
+    def _bars(self, data: Bars) -> OHLCV:
+        """
+        Convert a DataFrame to OHLCV arrays, reusing the last conversion.
 
-    def calculate_adx(self, df: pd.DataFrame) -> float:
-        """Calculate Average Directional Index."""
-        high = df['high']
-        low = df['low']
-        close = df['close']
-
-        # True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        # Directional Movement
-        up_move = high - high.shift(1)
-        down_move = low.shift(1) - low
+        The same DataFrame object with the same length and last index label
+        maps to the same OHLCV instance, which keys the downstream caches.
+        DataFrames are expected to be replaced, not modified in place,
+        between ticks.
+        """
+        if isinstance(data, OHLCV):
+            return data
+        n = len(data)
+        last = data.index[-1] if n else None
+        cached = self._bars_cache
+        if cached is not None and cached[0] is data and cached[1] == n and cached[2] == last:
+            return cached[3]
+        bars = OHLCV.from_df(data)
+        self._bars_cache = (data, n, last, bars)
+        return bars
+
+    def _compute_tr(self, data: Bars) -> np.ndarray:
+        """
+        Calculate True Range as a NumPy array.
 
-        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
-        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+        The result is cached for the most recent bars so ADX, ATR ratio
+        and the strategy indicators share one pass per bar. It is written
+        into a buffer reused across calls, so it is only valid until TR
+        is computed for different bars.
+        """
+        bars = self._bars(data)
+        cached = self._tr_cache
+        if cached is not None and cached[0] is bars:
+            return cached[1]
+
+        high, low, close = bars.high, bars.low, bars.close
+        n = len(close)
+        if len(self._tr_buf) < n:
+            self._tr_buf = np.empty(n, dtype=np.float32)
+            self._tr_scratch = np.empty(n, dtype=np.float32)
+        tr = self._tr_buf[:n]
+        gap = self._tr_scratch[:max(n - 1, 0)]
+
+        # fmax skips NaN like pandas' row-wise max; the first bar is high - low
+        np.subtract(high, low, out=tr)
+        for extreme in (high, low):
+            np.subtract(extreme[1:], close[:-1], out=gap)
+            np.fabs(gap, out=gap)
+            np.fmax(tr[1:], gap, out=tr[1:])
+
+        self._tr_cache = (bars, tr)
+        return tr
+
+    def _adx_atr(
+        self, data: Bars, with_adx: bool = True
+    ) -> Tuple[float, float, float, float, np.ndarray]:
+        """
+        Run the fused ADX/ATR kernel over the bars.
 
-        # Smoothed values
-        atr = pd.Series(tr).ewm(span=self.window_short, adjust=False).mean()
-        plus_di = 100 * pd.Series(plus_dm).ewm(span=self.window_short, adjust=False).mean() / atr
-        minus_di = 100 * pd.Series(minus_dm).ewm(span=self.window_short, adjust=False).mean() / atr
+        The result is cached for the most recent bars, so ADX and ATR ratio
+        share one pass. with_adx=False skips the directional movement part
+        when only the ATR values are needed.
 
-        # ADX
-        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
-        adx = dx.ewm(span=self.window_short, adjust=False).mean()
+        Returns:
+            Tuple of (atr, plus_dm_smooth, minus_dm_smooth, adx, atr_tail)
+            as returned by adx_atr_kernel
+        """
+        bars = self._bars(data)
+        cached = self._adx_atr_cache
+        if cached is not None and cached[0] is bars and (cached[1] or not with_adx):
+            return cached[2]
+        result = adx_atr_kernel(
+            bars.high, bars.low, bars.close, self.window_short, self.window_long, with_adx
+        )
+        self._adx_atr_cache = (bars, with_adx, result)
+        return result
 
-        return float(adx.iloc[-1])
+    def calculate_adx(self, data: Bars) -> float:
+        """Calculate Average Directional Index."""
+        talib = self.talib
+        if talib is not None:
+            bars = self._bars(data)
+            return float(talib.ADX(*_float64_hlc(bars), timeperiod=self.window_short)[-1])
+        return float(self._adx_atr(data)[3])
 
-    def calculate_atr_ratio(self, df: pd.DataFrame) -> float:
+    def calculate_atr_ratio(self, data: Bars) -> float:
         """Calculate ATR ratio (current ATR / MA of ATR)."""
-        high = df['high']
-        low = df['low']
-        close = df['close']
-
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        atr = tr.ewm(span=self.window_short, adjust=False).mean()
-        atr_ma = atr.rolling(window=self.window_long).mean()
+        talib = self.talib
+        if talib is not None:
+            atr = talib.ATR(*_float64_hlc(self._bars(data)), timeperiod=self.window_short)
+            current_atr = atr[-1] if len(atr) else np.nan
+            atr_tail = atr[-self.window_long:]
+        else:
+            current_atr, _, _, _, atr_tail = self._adx_atr(data, with_adx=False)
+        if len(atr_tail) < self.window_long:
+            return 1.0
 
-        current_atr = atr.iloc[-1]
-        avg_atr = atr_ma.iloc[-1]
+        # Moving average at the last bar only: mean of the trailing window
+        avg_atr = float(atr_tail.mean())
 
         if avg_atr > 0:
-            return current_atr / avg_atr
+            return float(current_atr) / avg_atr
         return 1.0
 
-    def detect_regime(self, df: pd.DataFrame) -> Tuple[MarketRegime, float, float]:
+    def detect_regime(self, data: Bars) -> Tuple[MarketRegime, float, float]:
         """
         Detect market regime based on ADX and ATR ratio.
 
+        Accepts a DataFrame or OHLCV arrays. Repeated calls with the same
+        bars return the cached result without recomputing.
+
         Returns:
             Tuple of (regime, adx, atr_ratio)
         """
-        if len(df) < self.window_long:
+        if len(data) < self.window_long:
             return MarketRegime.UNKNOWN, 0.0, 1.0
 
-        adx = self.calculate_adx(df)
-        atr_ratio = self.calculate_atr_ratio(df)
+        bars = self._bars(data)
+        cached = self._regime_cache
+        if cached is not None and cached[0] is bars:
+            return cached[1]
+
+        adx = self._held_adx(bars)
+        if adx is None:
+            adx = self.calculate_adx(bars)
+            self._adx_anchor = (adx, bars.ts[-1], float(bars.close[-1]), 0)
+        atr_ratio = self.calculate_atr_ratio(bars)
+
+        result = (self.classify(adx, atr_ratio), adx, atr_ratio)
+        self._regime_cache = (bars, result)
+        return result
+
+    def _held_adx(self, bars: OHLCV) -> Optional[float]:
+        """
+        Last computed ADX, if the ADX side of the quadrant cannot have flipped.
+
+        DX lies in [0, 100], so each bar moves ADX by at most alpha * 100
+        and k bars by at most 100 * (1 - (1 - alpha)^k). While the last
+        computed ADX is further than that from adx_threshold, the regime
+        is unchanged on that axis and the ADX recompute is skipped. The
+        ATR ratio has no such bound and is always recomputed.
+
+        Only active with ADX_HOLD=true, since the reported ADX is then the
+        value from the anchor bar rather than the current one.
+        """
+        anchor = self._adx_anchor
+        if not self.hold_adx or anchor is None:
+            return None
+
+        adx, ts, close, held = anchor
+        i = -(held + 2)  # anchor bar's position if bars continue from it
+        if len(bars) < -i or float(bars.close[i]) != close or not bool(bars.ts[i] == ts):
+            return None
+
+        alpha = 2.0 / (self.window_short + 1)
+        drift = 100 * (1 - (1 - alpha) ** (held + 1))
+        if not abs(adx - self.adx_threshold) > drift:
+            return None
+
+        self._adx_anchor = (adx, ts, close, held + 1)
+        return adx
 
-        # 4-Quadrant Classification using production thresholds
+    def classify(self, adx: float, atr_ratio: float) -> MarketRegime:
+        """4-Quadrant Classification using production thresholds."""
         if adx > self.adx_threshold:
             if atr_ratio < self.atr_vol_threshold:
-                regime = MarketRegime.STABLE_TREND
-            else:
-                regime = MarketRegime.VOLATILE_TREND
-        else:
-            if atr_ratio < self.atr_vol_threshold:
-                regime = MarketRegime.SIDEWAYS_QUIET
-            else:
-                regime = MarketRegime.SIDEWAYS_CHOP
+                return MarketRegime.STABLE_TREND
+            return MarketRegime.VOLATILE_TREND
+        if atr_ratio < self.atr_vol_threshold:
+            return MarketRegime.SIDEWAYS_QUIET
+        return MarketRegime.SIDEWAYS_CHOP
+
+
+class IndicatorState:
+    """
+    Online EMA/ATR/ADX/ATR-ratio state advanced one bar at a time.
+
+    warmup() seeds the state from the full bar history using the same
+    series as calculate_indicators() and RegimeDetector; update() then
+    applies one step of each recurrence, s = alpha * x + (1 - alpha) * s,
+    so a new bar costs O(1) instead of a full recompute. The ATR moving
+    average behind the ATR ratio is a running sum over the last
+    window_long values.
+
+    Once seeded, values follow the whole stream of bars fed to the state,
+    not just the bars still present in a fixed-length window.
+    """
+
+    __slots__ = (
+        "ema_alpha", "atr_alpha", "adx_alpha", "window_long",
+        "ema", "atr", "atr_short", "plus", "minus", "adx",
+        "atr_hist", "atr_sum",
+        "prev_high", "prev_low", "prev_close", "last_ts",
+    )
+
+    def __init__(self, ema_alpha: float, atr_alpha: float, adx_alpha: float, window_long: int):
+        self.ema_alpha = ema_alpha
+        self.atr_alpha = atr_alpha
+        self.adx_alpha = adx_alpha
+        self.window_long = window_long
+
+        self.ema = 0.0
+        self.atr = 0.0
+        self.atr_short = 0.0
+        self.plus = 0.0
+        self.minus = 0.0
+        self.adx = 0.0
+        self.atr_hist: Deque[float] = deque(maxlen=window_long)
+        self.atr_sum = 0.0
+
+        self.prev_high = np.nan
+        self.prev_low = np.nan
+        self.prev_close = np.nan
+        self.last_ts = None
+
+    def warmup(self, bars: OHLCV, detector: RegimeDetector) -> None:
+        """Seed the state from the full history of bars."""
+        tr = detector._compute_tr(bars)
+        atr_short, plus, minus, adx, atr_tail = detector._adx_atr(bars)
+
+        self.ema = float(ewm_mean(bars.close, self.ema_alpha)[-1])
+        self.atr = float(ewm_mean(tr, self.atr_alpha)[-1])
+        self.atr_short = float(atr_short)
+        self.plus = float(plus)
+        self.minus = float(minus)
+        self.adx = float(adx)
+
+        self.atr_hist.clear()
+        self.atr_hist.extend(atr_tail.tolist())
+        self.atr_sum = sum(self.atr_hist)
+
+        self._mark(bars, -1)
+
+    def update(
+        self, high: float, low: float, close: float, ts=None
+    ) -> Tuple[float, float, float, float]:
+        """
+        Advance every indicator by one new bar.
+
+        Returns:
+            Tuple of (ema, atr, adx, atr_ratio) after the bar
+        """
+        pc = self.prev_close
+        tr = max(high - low, abs(high - pc), abs(low - pc))
+        up_move = high - self.prev_high
+        down_move = self.prev_low - low
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+
+        a = self.ema_alpha
+        self.ema = a * close + (1 - a) * self.ema
+        a = self.atr_alpha
+        self.atr = a * tr + (1 - a) * self.atr
+
+        a = self.adx_alpha
+        self.atr_short = a * tr + (1 - a) * self.atr_short
+        self.plus = a * plus_dm + (1 - a) * self.plus
+        self.minus = a * minus_dm + (1 - a) * self.minus
+        if self.atr_short > 0:
+            plus_di = 100 * self.plus / self.atr_short
+            minus_di = 100 * self.minus / self.atr_short
+            dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
+            self.adx = a * dx + (1 - a) * self.adx
+
+        # Running sum over the last window_long ATR values
+        if len(self.atr_hist) == self.window_long:
+            self.atr_sum -= self.atr_hist[0]
+        self.atr_hist.append(self.atr_short)
+        self.atr_sum += self.atr_short
+
+        self.prev_high = high
+        self.prev_low = low
+        self.prev_close = close
+        self.last_ts = ts
+        return self.ema, self.atr, self.adx, self.atr_ratio
+
+    @property
+    def atr_ratio(self) -> float:
+        """Current ATR / MA of ATR over window_long bars."""
+        if len(self.atr_hist) == self.window_long:
+            avg_atr = self.atr_sum / self.window_long
+            if avg_atr > 0:
+                return self.atr_short / avg_atr
+        return 1.0
+
+    def is_at(self, bars: OHLCV, i: int) -> bool:
+        """Whether bar i of bars is the last bar this state has seen."""
+        return (
+            float(bars.close[i]) == self.prev_close
+            and float(bars.high[i]) == self.prev_high
+            and float(bars.low[i]) == self.prev_low
+            and bool(bars.ts[i] == self.last_ts)
+        )
+
+    def _mark(self, bars: OHLCV, i: int) -> None:
+        self.prev_high = float(bars.high[i])
+        self.prev_low = float(bars.low[i])
+        self.prev_close = float(bars.close[i])
+        self.last_ts = bars.ts[i]
+
+
+def _make_spacer(base_pct: float, atr_mult: float) -> Callable[[float, float], float]:
+    """
+    Specialize the adaptive spacing formula for fixed parameters.
+
+    Returns spacer(price, atr) computing the same value as
+    ATRGridStrategy._calculate_adaptive_spacing, with base_pct and
+    atr_mult bound as closure variables.
+    """
+    def spacer(price: float, atr: float) -> float:
+        return max(atr * atr_mult, price * base_pct)
+    return spacer
 
-        return regime, adx, atr_ratio
+
+def _make_pricers(
+    base_pct: float, atr_mult: float, tp_mult: float, sl_factor: float, sign: float
+) -> Tuple[Callable[[float, float], float], Callable[[float, float], float], Callable[[float], float]]:
+    """
+    Specialize entry, take profit and stop loss pricing for one regime and side.
+
+    sign is +1.0 for LONG and -1.0 for SHORT; sl_factor is the matching
+    RegimeConfig.sl_long_factor / sl_short_factor.
+
+    Returns:
+        Tuple of (entry(price, atr), tp(entry_price, spacing), sl(avg_entry_price))
+    """
+    def entry_price(price: float, atr: float) -> float:
+        return price - sign * max(atr * atr_mult, price * base_pct)
+
+    def tp_price(entry: float, spacing: float) -> float:
+        return entry + sign * (spacing * tp_mult)
+
+    def sl_price(avg_entry: float) -> float:
+        return avg_entry * sl_factor
+
+    return entry_price, tp_price, sl_price
 
 
 class ATRGridStrategy:
@@ -299,28 +806,70 @@ class ATRGridStrategy:
         # Regime detector
         self.regime_detector = RegimeDetector()
 
-    def calculate_indicators(self, df: pd.DataFrame) -> Tuple[float, float]:
-        """Calculate EMA and ATR from OHLCV data."""
-        if len(df) < self.ema_period:
-            return 0.0, 0.0
+        # (bars, full_series, (ema, atr)) for the last call
+        self._indicator_cache: Optional[Tuple[OHLCV, bool, Tuple[float, float]]] = None
+        # Online indicators per symbol for the bars passed to generate_signal()
+        self._indicator_states: Dict[Optional[str], IndicatorState] = {}
+        # Spacing functions specialized per regime (see _spacer_for)
+        self._spacers: Dict[Optional[MarketRegime], Callable[[float, float], float]] = {}
+        # Entry/TP/SL functions specialized per (regime, is_long) (see pricing_fns)
+        self._pricers: Dict[Tuple[Optional[MarketRegime], bool], Tuple[Callable, Callable, Callable]] = {}
+        # Single-process executors for generate_signals_bulk(), kept until
+        # close(), and the one each symbol is pinned to
+        self._bulk_workers: List[ProcessPoolExecutor] = []
+        self._bulk_routes: Dict[str, ProcessPoolExecutor] = {}
+
+    def calculate_indicators(
+        self,
+        data: Bars,
+        full_series: bool = False,
+    ) -> Tuple[float, float]:
+        """
+        Calculate EMA and ATR from OHLCV data (DataFrame or OHLCV arrays).
 
-        # EMA
-        ema_series = df['close'].ewm(span=self.ema_period, adjust=False).mean()
-        current_ema = ema_series.iloc[-1]
+        Only the latest values are needed, so by default they are evaluated
+        as a weighted sum over the recent tail (see ewm_last). Pass
+        full_series=True to run the full recursive series instead. With
+        USE_TALIB=true and TA-Lib installed, TA-Lib's EMA/ATR are used.
 
-        # ATR
-        high = df['high']
-        low = df['low']
-        close = df['close']
+        Repeated calls with the same bars return the cached result
+        without recomputing.
+        """
+        if len(data) < self.ema_period:
+            return 0.0, 0.0
 
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr_series = tr.ewm(span=self.atr_period, adjust=False).mean()
-        current_atr = atr_series.iloc[-1]
+        # Conversion shared with the regime detector
+        bars = self.regime_detector._bars(data)
+        cached = self._indicator_cache
+        if cached is not None and cached[0] is bars and cached[1] == full_series:
+            return cached[2]
+
+        talib = self.regime_detector.talib
+        if talib is not None:
+            high, low, close = _float64_hlc(bars)
+            result = (
+                float(talib.EMA(close, timeperiod=self.ema_period)[-1]),
+                float(talib.ATR(high, low, close, timeperiod=self.atr_period)[-1]),
+            )
+            self._indicator_cache = (bars, full_series, result)
+            return result
+
+        ema_alpha = 2.0 / (self.ema_period + 1)
+
+        # ATR input (True Range shared with the regime detector)
+        tr = self.regime_detector._compute_tr(bars)
+        atr_alpha = 2.0 / (self.atr_period + 1)
+
+        if full_series:
+            current_ema = ewm_mean(bars.close, ema_alpha)[-1]
+            current_atr = ewm_mean(tr, atr_alpha)[-1]
+        else:
+            current_ema = ewm_last(bars.close, ema_alpha)
+            current_atr = ewm_last(tr, atr_alpha)
 
-        return float(current_ema), float(current_atr)
+        result = (float(current_ema), float(current_atr))
+        self._indicator_cache = (bars, full_series, result)
+        return result
 
     def get_regime_config(self, regime: MarketRegime) -> RegimeConfig:
         """Get configuration for a specific market regime."""
@@ -328,28 +877,47 @@ class ATRGridStrategy:
             initialize_regime_configs()
         return REGIME_CONFIGS.get(regime, REGIME_CONFIGS.get(MarketRegime.UNKNOWN))
 
+    def _resolve_config(
+        self,
+        regime: Optional[MarketRegime],
+        config: Optional[RegimeConfig] = None,
+    ) -> RegimeConfig:
+        """
+        Get the config to price with: the given one, else the regime's.
+
+        A regime without a loaded config gets neutral parameters (no base
+        spacing, 1x TP, no SL drawdown); no regime at all gets the
+        DEFAULT_* environment fallbacks.
+        """
+        if config is not None:
+            return config
+        if regime:
+            return self.get_regime_config(regime) or _MISSING_REGIME_CONFIG
+        return _DEFAULT_REGIME_CONFIG
+
     def should_skip_entry(
         self,
         regime: MarketRegime,
         adx: float,
         is_bearish: bool,
-        volatility_ratio: float
+        volatility_ratio: float,
+        config: Optional[RegimeConfig] = None,
     ) -> Tuple[bool, str]:
         """
         Determine if entry should be skipped based on market conditions.
 
         Logic uses production-configured thresholds for AI filtering.
+        Pass config to reuse an already resolved regime config.
         """
         # Skip conditions based on production config
-        config = self.get_regime_config(regime)
-        if config is None:
-            return False, ""
+        config = self._resolve_config(regime, config)
 
         vol_threshold = config.volatility_threshold
         ai_filter_strict = config.ai_filter_strict
 
         if ai_filter_strict and is_bearish and volatility_ratio > vol_threshold:
-            return True, f"AI Filter ({regime.value})"
+            reason = _AI_FILTER_REASONS.get(regime)
+            return True, reason if reason is not None else f"AI Filter ({regime.value})"
 
         return False, ""
 
@@ -359,6 +927,7 @@ class ATRGridStrategy:
         current_price: float,
         current_atr: float,
         regime: Optional[MarketRegime] = None,
+        config: Optional[RegimeConfig] = None,
     ) -> float:
         """
         Calculate the next entry price for dynamic DCA.
@@ -367,21 +936,60 @@ class ATRGridStrategy:
         - Entry is always relative to CURRENT price (Trailing Entry)
         - Long Entry = Current * (1 - Spacing)
         - Short Entry = Current * (1 + Spacing)
+
+        Any direction other than LONG is treated as SHORT. Pass config
+        to price with an already resolved regime config.
         """
-        # Get spacing from regime config
-        if regime:
-            config = self.get_regime_config(regime)
-            base_spacing_pct = config.base_spacing_pct if config else 0
-        else:
-            base_spacing_pct = float(os.getenv("DEFAULT_SPACING_PCT", "0"))
+        if config is None:
+            return self.pricing_fns(regime, direction)[0](current_price, current_atr)
+
+        spacing = self._calculate_adaptive_spacing(
+            current_price, current_atr, config.base_spacing_pct, regime
+        )
+        sign = 1.0 if direction == _LONG else -1.0  # SHORT
+        return current_price - sign * spacing
 
-        # Calculate spacing using proprietary formula
-        spacing = self._calculate_adaptive_spacing(current_price, current_atr, base_spacing_pct, regime)
+    def pricing_fns(
+        self,
+        regime: Optional[MarketRegime],
+        direction: GridDirection,
+    ) -> Tuple[Callable[[float, float], float], Callable[[float, float], float], Callable[[float], float]]:
+        """
+        Get entry, TP and SL price functions specialized for a regime and side.
 
-        if direction == GridDirection.LONG:
-            return current_price - spacing
-        else:  # SHORT
-            return current_price + spacing
+        The regime's parameters and the direction sign are bound into the
+        functions, built once per (regime, side), so per-level pricing does
+        no config lookups or direction branches. Any direction other than
+        LONG is treated as SHORT, as in the calculate_*_price methods.
+
+        Returns:
+            Tuple of (entry(price, atr), tp(entry_price, spacing), sl(avg_entry_price))
+        """
+        is_long = direction == _LONG
+        pricers = self._pricers.get((regime, is_long))
+        if pricers is None:
+            config = self._resolve_config(regime)
+            pricers = self._pricers[(regime, is_long)] = _make_pricers(
+                config.base_spacing_pct,
+                self.sl_atr_mult,
+                config.tp_mult,
+                config.sl_long_factor if is_long else config.sl_short_factor,
+                1.0 if is_long else -1.0,
+            )
+        return pricers
+
+    def _spacer_for(self, regime: Optional[MarketRegime]) -> Callable[[float, float], float]:
+        """
+        Get the spacing function for a regime, built once per regime.
+
+        The regime's base spacing and sl_atr_mult are bound into the
+        function, so both are read once rather than on every call.
+        """
+        spacer = self._spacers.get(regime)
+        if spacer is None:
+            base_spacing_pct = self._resolve_config(regime).base_spacing_pct
+            spacer = self._spacers[regime] = _make_spacer(base_spacing_pct, self.sl_atr_mult)
+        return spacer
 
     def _calculate_adaptive_spacing(
         self,
@@ -406,36 +1014,124 @@ class ATRGridStrategy:
         entry_price: float,
         spacing: float,
         regime: Optional[MarketRegime] = None,
+        config: Optional[RegimeConfig] = None,
     ) -> float:
         """Calculate take profit price for a grid level."""
-        if regime:
-            config = self.get_regime_config(regime)
-            tp_mult = config.tp_mult if config else 1.0
-        else:
-            tp_mult = float(os.getenv("DEFAULT_TP_MULT", "1"))
+        if config is None:
+            return self.pricing_fns(regime, direction)[1](entry_price, spacing)
 
-        if direction == GridDirection.LONG:
-            return entry_price + (spacing * tp_mult)
-        else:  # SHORT
-            return entry_price - (spacing * tp_mult)
+        tp_mult = config.tp_mult
+
+        sign = 1.0 if direction == _LONG else -1.0  # SHORT
+        return entry_price + sign * (spacing * tp_mult)
 
     def calculate_sl_price(
         self,
         direction: GridDirection,
         avg_entry_price: float,
         regime: Optional[MarketRegime] = None,
+        config: Optional[RegimeConfig] = None,
     ) -> float:
         """Calculate stop loss price based on regime configuration."""
-        if regime:
-            config = self.get_regime_config(regime)
-            sl_drawdown = config.sl_drawdown if config else 0
+        if config is None:
+            return self.pricing_fns(regime, direction)[2](avg_entry_price)
+
+        if direction == _LONG:
+            return avg_entry_price * config.sl_long_factor
+        return avg_entry_price * config.sl_short_factor  # SHORT
+
+    def build_grid_prices(
+        self,
+        direction: GridDirection,
+        current_price: float,
+        current_atr: float,
+        regime: Optional[MarketRegime] = None,
+        num_levels: Optional[int] = None,
+        config: Optional[RegimeConfig] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Entry and take profit prices for every grid level of one side.
+
+        Level i (1-based) is placed i spacings away from the current price
+        with its take profit tp_mult spacings back toward it, matching
+        calculate_next_entry_price / calculate_tp_price applied level by
+        level. The spacing is computed once and all levels in one ufunc
+        chain; call once per side for Hedge Mode.
+
+        Args:
+            direction: LONG or SHORT
+            current_price: Reference price for the grid
+            current_atr: Current ATR value
+            regime: Market regime used for spacing, TP and level count
+            num_levels: Number of levels (defaults to regime/strategy max_levels)
+            config: Already resolved regime config (defaults to the regime's)
+
+        Returns:
+            Tuple of (entry_prices, tp_prices) float64 arrays, nearest level first
+        """
+        if config is None:
+            spacer = self._spacer_for(regime)
         else:
-            sl_drawdown = float(os.getenv("DEFAULT_SL_DRAWDOWN", "0"))
+            spacer = _make_spacer(config.base_spacing_pct, self.sl_atr_mult)
+        config = self._resolve_config(regime, config)
+
+        n = max(num_levels or config.max_levels or self.max_levels, 0)
+        spacing = spacer(current_price, current_atr)
+        sign = 1.0 if direction == _LONG else -1.0
+
+        offsets = spacing * np.arange(1, n + 1, dtype=np.float64)
+        entries = current_price - sign * offsets
+        tps = entries + sign * (spacing * config.tp_mult)
+        return entries, tps
+
+    def build_grid(
+        self,
+        direction: GridDirection,
+        current_price: float,
+        current_atr: float,
+        quantity: float,
+        regime: Optional[MarketRegime] = None,
+        num_levels: Optional[int] = None,
+        config: Optional[RegimeConfig] = None,
+    ) -> List[GridLevel]:
+        """
+        Build pending grid levels for a direction from build_grid_prices().
+
+        GridDirection.BOTH builds the LONG and SHORT sides (Hedge Mode).
+
+        Args:
+            direction: LONG, SHORT or BOTH
+            current_price: Reference price for the grid
+            current_atr: Current ATR value
+            quantity: Order quantity per level
+            regime: Market regime used for spacing, TP and level count
+            num_levels: Number of levels (defaults to regime/strategy max_levels)
+            config: Already resolved regime config (defaults to the regime's)
 
-        if direction == GridDirection.LONG:
-            return avg_entry_price * (1 - sl_drawdown)
-        else:  # SHORT
-            return avg_entry_price * (1 + sl_drawdown)
+        Returns:
+            List of pending GridLevel objects, nearest level first
+        """
+        if direction == _BOTH:
+            return (
+                self.build_grid(_LONG, current_price, current_atr, quantity, regime, num_levels, config)
+                + self.build_grid(_SHORT, current_price, current_atr, quantity, regime, num_levels, config)
+            )
+        if direction not in (_LONG, _SHORT):
+            return []
+
+        entries, tps = self.build_grid_prices(
+            direction, current_price, current_atr, regime, num_levels, config
+        )
+        return [
+            GridLevel(
+                level=level,
+                direction=direction,
+                entry_price=entry_price,
+                tp_price=tp_price,
+                quantity=quantity,
+            )
+            for level, (entry_price, tp_price) in enumerate(zip(entries.tolist(), tps.tolist()), start=1)
+        ]
 
     def update_trailing_sl(
         self,
@@ -452,54 +1148,116 @@ class ATRGridStrategy:
         Returns:
             Tuple of (new_sl, new_highest, new_lowest)
         """
-        new_highest = highest_price
-        new_lowest = lowest_price
-        new_sl = current_sl
+        # The stop only ever ratchets toward the price: max/min instead of
+        # data-dependent comparisons
+        if direction == _LONG:
+            new_highest = max(highest_price, current_price)
+            new_sl = max(current_sl, new_highest * (1 - sl_drawdown))
+            return new_sl, new_highest, lowest_price
+
+        # SHORT
+        new_lowest = min(lowest_price, current_price)
+        new_sl = min(current_sl, new_lowest * (1 + sl_drawdown))
+        return new_sl, highest_price, new_lowest
+
+    def update_trailing_sl_batch(
+        self,
+        direction: GridDirection,
+        prices: np.ndarray,
+        current_sl: float,
+        highest_price: float,
+        lowest_price: float,
+        sl_drawdown: float,
+    ) -> np.ndarray:
+        """
+        Trailing stop loss over a whole price sequence, e.g. for backtests.
 
-        if direction == GridDirection.LONG:
-            if current_price > highest_price:
-                new_highest = current_price
-            trailing_sl = new_highest * (1 - sl_drawdown)
-            if trailing_sl > current_sl:
-                new_sl = trailing_sl
+        Same as calling update_trailing_sl() for each price in turn and
+        collecting new_sl, computed in a single compiled pass.
 
-        else:  # SHORT
-            if current_price < lowest_price:
-                new_lowest = current_price
-            trailing_sl = new_lowest * (1 + sl_drawdown)
-            if trailing_sl < current_sl:
-                new_sl = trailing_sl
+        Returns:
+            Array of stop loss prices, one per input price
+        """
+        if direction == _LONG:
+            return trailing_sl_path(prices, current_sl, highest_price, 1 - sl_drawdown, True)
+        return trailing_sl_path(prices, current_sl, lowest_price, 1 + sl_drawdown, False)  # SHORT
 
-        return new_sl, new_highest, new_lowest
+    def _sync_indicator_state(self, bars: OHLCV, symbol: Optional[str] = None) -> Optional[IndicatorState]:
+        """
+        Bring the online indicator state for a symbol up to date with bars.
+
+        If bars extend the previously seen bars by exactly one bar, the
+        state is advanced in O(1); if they end on that same bar it is
+        reused as is; anything else re-seeds it from the full history.
+        Returns None while bars are too short for EMA and regime detection,
+        or when TA-Lib indicators are enabled, leaving those cases to the
+        full recompute.
+        """
+        detector = self.regime_detector
+        if detector.use_talib or len(bars) < max(self.ema_period, detector.window_long, 2):
+            return None
+
+        state = self._indicator_states.get(symbol)
+        if state is not None:
+            if state.is_at(bars, -1):
+                return state
+            high, low, close = float(bars.high[-1]), float(bars.low[-1]), float(bars.close[-1])
+            # NaN in the new bar falls through to a full re-seed
+            if state.is_at(bars, -2) and high == high and low == low and close == close:
+                state.update(high, low, close, bars.ts[-1])
+                return state
+
+        state = IndicatorState(
+            ema_alpha=2.0 / (self.ema_period + 1),
+            atr_alpha=2.0 / (self.atr_period + 1),
+            adx_alpha=2.0 / (detector.window_short + 1),
+            window_long=detector.window_long,
+        )
+        state.warmup(bars, detector)
+        self._indicator_states[symbol] = state
+        return state
 
     def generate_signal(
         self,
-        df: pd.DataFrame,
+        df: Bars,
         current_price: float,
+        symbol: Optional[str] = None,
     ) -> Dict:
         """
-        Generate trading signal from OHLCV data.
+        Generate trading signal from OHLCV data (DataFrame or OHLCV arrays).
+
+        Indicators are kept as online state per symbol: when df adds one
+        bar to the previous call's bars for the same symbol, they are
+        advanced by that bar instead of recomputed over the full history.
+
+        Args:
+            df: OHLCV bars, oldest first
+            current_price: Latest traded price
+            symbol: Key for the per-symbol indicator state
 
         Returns:
             Dict with signal information
         """
-        ema, atr = self.calculate_indicators(df)
-        regime, adx, atr_ratio = self.regime_detector.detect_regime(df)
+        bars = self.regime_detector._bars(df)
+        state = self._sync_indicator_state(bars, symbol)
+        if state is None:
+            ema, atr = self.calculate_indicators(bars)
+            regime, adx, atr_ratio = self.regime_detector.detect_regime(bars)
+        else:
+            ema, atr = state.ema, state.atr
+            adx, atr_ratio = state.adx, state.atr_ratio
+            regime = self.regime_detector.classify(adx, atr_ratio)
 
-        is_bullish = current_price > ema
-        is_bearish = current_price < ema
+        diff = current_price - ema
+        sign = int(diff > 0) - int(diff < 0)  # -1/0/+1, 0 for NaN
+        is_bullish = sign > 0
+        is_bearish = sign < 0
+        direction = _DIR_BY_SIGN[sign + 1]
 
         skip_entry, skip_reason = self.should_skip_entry(
-            regime, adx, is_bearish, atr_ratio
+            regime, adx, is_bearish, atr_ratio, self._resolve_config(regime)
         )
 
-        if is_bullish:
-            direction = GridDirection.LONG
-        elif is_bearish:
-            direction = GridDirection.SHORT
-        else:
-            direction = GridDirection.NEUTRAL
-
         return {
             "current_price": current_price,
             "ema": ema,
@@ -514,6 +1272,87 @@ class ATRGridStrategy:
             "skip_reason": skip_reason,
         }
 
+    def generate_signals_bulk(
+        self,
+        dfs: Dict[str, Bars],
+        prices: Dict[str, float],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Generate signals for many symbols in parallel worker processes.
+
+        Each symbol's bars are sent as OHLCV arrays (pickled as raw
+        buffers) to a worker that runs generate_signal() with this
+        strategy's periods. Workers load the Numba kernels from the
+        on-disk cache instead of recompiling them. Pays off for large
+        baskets and backtests; for a handful of live symbols calling
+        generate_signal() in-process is cheaper than the process hop.
+
+        The worker processes are started on the first call and reused
+        until close(). Each symbol is pinned to one worker, so its online
+        indicator state carries over between calls and a bars update that
+        adds one bar costs O(1) there as well.
+
+        Args:
+            dfs: Bars per symbol (DataFrame or OHLCV arrays)
+            prices: Current price per symbol
+            max_workers: Worker processes (defaults to the CPU count);
+                only used when the workers are started
+
+        Returns:
+            Signal dict per symbol, in the order of dfs
+        """
+        workers = self._bulk_workers
+        if not workers:
+            workers.extend(
+                ProcessPoolExecutor(max_workers=1)
+                for _ in range(max_workers or os.cpu_count() or 1)
+            )
+        routes = self._bulk_routes
+        periods = (self.ema_period, self.atr_period, self.max_levels)
+        futures = []
+        for symbol, data in dfs.items():
+            worker = routes.get(symbol)
+            if worker is None:
+                worker = routes[symbol] = workers[len(routes) % len(workers)]
+            futures.append(worker.submit(
+                _generate_signal_worker,
+                periods,
+                symbol,
+                data if isinstance(data, OHLCV) else OHLCV.from_df(data),
+                prices[symbol],
+            ))
+
+        results: Dict[str, Dict] = {}
+        for future in as_completed(futures):
+            symbol, signal = future.result()
+            results[symbol] = signal
+        return {symbol: results[symbol] for symbol in dfs}
+
+    def close(self) -> None:
+        """Shut down the generate_signals_bulk() worker processes, if started."""
+        for worker in self._bulk_workers:
+            worker.shutdown()
+        self._bulk_workers.clear()
+        self._bulk_routes.clear()
+
+
+# Strategy per (ema_period, atr_period, max_levels) in each worker process
+_worker_strategies: Dict[Tuple[int, int, int], ATRGridStrategy] = {}
+
+
+def _generate_signal_worker(
+    periods: Tuple[int, int, int],
+    symbol: str,
+    bars: OHLCV,
+    current_price: float,
+) -> Tuple[str, Dict]:
+    """Run generate_signal() for one symbol inside a worker process."""
+    strategy = _worker_strategies.get(periods)
+    if strategy is None:
+        strategy = _worker_strategies[periods] = ATRGridStrategy(*periods)
+    return symbol, strategy.generate_signal(bars, current_price, symbol)
+
 
 # Example usage
 if __name__ == "__main__":
@@ -9,12 +9,62 @@ Version: 9.5
 Note: Threshold values loaded from production configuration.
 """
 
+import math
 import os
-import pandas as pd
 import numpy as np
+from collections import deque
 from enum import Enum
-from typing import Tuple, Optional
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Deque, Dict, List, NamedTuple, Tuple, Optional
+from dataclasses import dataclass, field
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from ._indicators_njit import adx_atr_batch, adx_atr_kernel, adx_series, ewm_last, ewm_mean
+
+# Production configuration, read once at import
+_CFG_WINDOW_SHORT = int(os.getenv("ATR_WINDOW_SHORT", "14"))
+_CFG_WINDOW_LONG = int(os.getenv("ATR_WINDOW_LONG", "50"))
+_CFG_EMA_PERIOD = int(os.getenv("EMA_PERIOD", "200"))
+_CFG_ADX_THRESHOLD = float(os.getenv("ADX_THRESHOLD", "0"))
+_CFG_ATR_VOL_THRESHOLD = float(os.getenv("ATR_VOL_THRESHOLD", "0"))
+
+# Distinct bar sets whose analyze() result is kept per detector
+_ANALYSIS_CACHE_SIZE = 8
+
+
+def _hlc(df: "pd.DataFrame") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    High/low/close columns as arrays for the indicator kernels.
+
+    float32 and float64 prices are used as stored, without a copy; other
+    dtypes are converted to float64. Bars ingested as float32 (as in the
+    strategy's OHLCV) halve the memory the kernels stream, while EWM
+    smoothing still accumulates in float64.
+    """
+    high, low, close = df['high'], df['low'], df['close']
+    if high.dtype == low.dtype == close.dtype == np.float32:
+        dtype = np.float32
+    else:
+        dtype = np.float64
+    return (
+        high.to_numpy(dtype=dtype),
+        low.to_numpy(dtype=dtype),
+        close.to_numpy(dtype=dtype),
+    )
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True Range from high/low/close arrays.
+
+    NaN terms are skipped like pandas' row-wise max, so the first bar,
+    which has no previous close, is high - low.
+    """
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+    return np.fmax(high - low, np.fmax(np.fabs(high - prev_close), np.fabs(low - prev_close)))
 
 
 class MarketRegime(str, Enum):
@@ -38,9 +88,17 @@ class MarketRegime(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
-class RegimeAnalysis:
-    """Complete regime analysis result."""
+# Regimes indexed by 2 * is_trending + is_volatile (see detect_regime_array)
+_REGIME_LUT = (
+    MarketRegime.SIDEWAYS_QUIET,
+    MarketRegime.SIDEWAYS_CHOP,
+    MarketRegime.STABLE_TREND,
+    MarketRegime.VOLATILE_TREND,
+)
+
+
+class RegimeAnalysis(NamedTuple):
+    """Complete regime analysis result (immutable; analyze() may return a cached instance)."""
     regime: MarketRegime
     trend_strength: float      # ADX value
     volatility_ratio: float    # ATR / MA(ATR)
@@ -51,6 +109,43 @@ class RegimeAnalysis:
     confidence: float          # 0-1 confidence score
 
 
+@dataclass(slots=True)
+class RegimeState:
+    """Running indicator values behind RegimeDetector.update()."""
+    atr: float = math.nan
+    plus_dm: float = math.nan      # Smoothed +DM
+    minus_dm: float = math.nan     # Smoothed -DM
+    adx: float = math.nan
+    ema: float = math.nan
+    prev_high: float = math.nan
+    prev_low: float = math.nan
+    prev_close: float = math.nan
+    atr_hist: Deque[float] = field(default_factory=deque)  # Last window_long ATR values
+    atr_sum: float = 0.0
+    bars: int = 0
+
+
+def _ewm_update(prev: float, x: float, alpha: float, decay: float) -> float:
+    """One adjust=False EWM step (decay = 1 - alpha); a NaN (unseeded) state starts at x."""
+    if prev != prev:
+        return x
+    return alpha * x + decay * prev
+
+
+def _unknown_analysis() -> RegimeAnalysis:
+    """Analysis result while there is not enough data to classify."""
+    return RegimeAnalysis(
+        regime=MarketRegime.UNKNOWN,
+        trend_strength=0.0,
+        volatility_ratio=1.0,
+        ema_value=0.0,
+        atr_value=0.0,
+        is_bullish=False,
+        is_bearish=False,
+        confidence=0.0,
+    )
+
+
 class RegimeDetector:
     """
     Market Regime Detection System.
@@ -77,15 +172,27 @@ class RegimeDetector:
             ema_period: EMA period for trend direction
         """
         # Load from production config or use defaults
-        self.window_short = window_short or int(os.getenv("ATR_WINDOW_SHORT", "14"))
-        self.window_long = window_long or int(os.getenv("ATR_WINDOW_LONG", "50"))
-        self.ema_period = ema_period or int(os.getenv("EMA_PERIOD", "200"))
+        self.window_short = window_short or _CFG_WINDOW_SHORT
+        self.window_long = window_long or _CFG_WINDOW_LONG
+        self.ema_period = ema_period or _CFG_EMA_PERIOD
+
+        # EWM smoothing factors, fixed for the detector's lifetime
+        self._alpha_short = 2.0 / (self.window_short + 1)
+        self._decay_short = 1.0 - self._alpha_short
+        self._alpha_ema = 2.0 / (self.ema_period + 1)
+        self._decay_ema = 1.0 - self._alpha_ema
 
         # Thresholds loaded from production config
-        self.adx_threshold = float(os.getenv("ADX_THRESHOLD", "0"))
-        self.atr_vol_threshold = float(os.getenv("ATR_VOL_THRESHOLD", "0"))
+        self.adx_threshold = _CFG_ADX_THRESHOLD
+        self.atr_vol_threshold = _CFG_ATR_VOL_THRESHOLD
+
+        # Streaming state for update(), seeded by warmup()
+        self._state: Optional[RegimeState] = None
+
+        # analyze() results by (len, last timestamp ns, last close), LRU order
+        self._analysis_cache: Dict[Tuple[int, int, float], RegimeAnalysis] = {}
 
-    def calculate_adx(self, df: pd.DataFrame) -> pd.Series:
+    def calculate_adx(self, df: "pd.DataFrame") -> "pd.Series":
         """
         Calculate Average Directional Index (ADX).
 
@@ -94,61 +201,52 @@ class RegimeDetector:
         Returns:
             Series with ADX values
         """
-        high = df['high']
-        low = df['low']
-        close = df['close']
-
-        # True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        # Directional Movement
-        up_move = high - high.shift(1)
-        down_move = low.shift(1) - low
+        import pandas as pd
 
-        # +DM and -DM
-        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
-        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+        # TR, +DM/-DM, their EWMs, DI, DX and ADX in one fused pass
+        return pd.Series(adx_series(*_hlc(df), self.window_short), index=df.index)
 
-        # Smoothed ATR
-        atr = pd.Series(tr).ewm(span=self.window_short, adjust=False).mean()
-
-        # +DI and -DI
-        plus_di = 100 * pd.Series(plus_dm).ewm(span=self.window_short, adjust=False).mean() / atr
-        minus_di = 100 * pd.Series(minus_dm).ewm(span=self.window_short, adjust=False).mean() / atr
-
-        # DX
-        di_sum = plus_di + minus_di
-        di_diff = abs(plus_di - minus_di)
-        dx = 100 * di_diff / (di_sum + 1e-10)  # Avoid division by zero
-
-        # ADX (smoothed DX)
-        adx = dx.ewm(span=self.window_short, adjust=False).mean()
-
-        return adx
-
-    def calculate_atr(self, df: pd.DataFrame) -> pd.Series:
+    def calculate_atr(self, df: "pd.DataFrame") -> "pd.Series":
         """
         Calculate Average True Range (ATR).
 
         Returns:
             Series with ATR values
         """
-        high = df['high']
-        low = df['low']
-        close = df['close']
+        import pandas as pd
+        tr = _true_range(*_hlc(df))
+        return pd.Series(ewm_mean(tr, self._alpha_short), index=df.index)
 
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    def _adx_atr(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        with_adx: bool = True,
+    ) -> Tuple[float, float, float]:
+        """
+        Latest ADX, ATR and ATR ratio from one pass of the fused kernel.
+
+        Returns:
+            Tuple of (adx, atr, atr_ratio); adx is NaN if with_adx is False
+        """
+        atr, _, _, adx, atr_tail = adx_atr_kernel(
+            high,
+            low,
+            close,
+            self.window_short,
+            self.window_long,
+            with_adx,
+        )
 
-        atr = tr.ewm(span=self.window_short, adjust=False).mean()
-        return atr
+        atr_ratio = 1.0
+        if len(atr_tail) >= self.window_long:
+            avg_atr = atr_tail.mean()
+            if avg_atr > 0:
+                atr_ratio = atr / avg_atr
+        return adx, atr, atr_ratio
 
-    def calculate_atr_ratio(self, df: pd.DataFrame) -> float:
+    def calculate_atr_ratio(self, df: "pd.DataFrame") -> float:
         """
         Calculate ATR ratio (current ATR / MA of ATR).
 
@@ -157,21 +255,13 @@ class RegimeDetector:
         Returns:
             Current ATR ratio
         """
-        atr = self.calculate_atr(df)
-        atr_ma = atr.rolling(window=self.window_long).mean()
+        return self._adx_atr(*_hlc(df), with_adx=False)[2]
 
-        current_atr = atr.iloc[-1]
-        avg_atr = atr_ma.iloc[-1]
-
-        if avg_atr > 0:
-            return current_atr / avg_atr
-        return 1.0
-
-    def calculate_ema(self, df: pd.DataFrame) -> pd.Series:
+    def calculate_ema(self, df: "pd.DataFrame") -> "pd.Series":
         """Calculate Exponential Moving Average."""
         return df['close'].ewm(span=self.ema_period, adjust=False).mean()
 
-    def detect_regime(self, df: pd.DataFrame) -> MarketRegime:
+    def detect_regime(self, df: "pd.DataFrame") -> MarketRegime:
         """
         Detect current market regime.
 
@@ -186,64 +276,158 @@ class RegimeDetector:
         if len(df) < self.window_long:
             return MarketRegime.UNKNOWN
 
-        adx = self.calculate_adx(df)
-        current_adx = adx.iloc[-1]
-        atr_ratio = self.calculate_atr_ratio(df)
+        current_adx, _, atr_ratio = self._adx_atr(*_hlc(df))
+        return self._classify(current_adx, atr_ratio)
+
+    def analyze_fast(self, df: "pd.DataFrame") -> Tuple[float, float, float, float]:
+        """
+        Latest indicator values from a single sweep over the bars.
+
+        The columns are extracted once; ADX, ATR and the ATR ratio come
+        from the fused kernel and the EMA from the recent tail of closes.
 
+        Returns:
+            Tuple of (adx, atr, atr_ratio, ema)
+        """
+        return self._compute_all(*_hlc(df))[:4]
+
+    def _compute_all(
+        self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        Every value analyze() needs, from one set of column arrays.
+
+        Returns:
+            Tuple of (adx, atr, atr_ratio, ema, last close)
+        """
+        adx, atr, atr_ratio = self._adx_atr(high, low, close)
+        ema = ewm_last(close, self._alpha_ema)
+        return float(adx), float(atr), float(atr_ratio), ema, float(close[-1])
+
+    def _classify(self, current_adx: float, atr_ratio: float) -> MarketRegime:
+        """Map ADX and ATR ratio to a regime quadrant."""
         # 4-Quadrant Classification using production thresholds
         is_trending = current_adx > self.adx_threshold
         is_volatile = atr_ratio >= self.atr_vol_threshold
+        return _REGIME_LUT[2 * is_trending + is_volatile]
 
-        if is_trending:
-            if is_volatile:
-                return MarketRegime.VOLATILE_TREND
-            else:
-                return MarketRegime.STABLE_TREND
-        else:
-            if is_volatile:
-                return MarketRegime.SIDEWAYS_CHOP
-            else:
-                return MarketRegime.SIDEWAYS_QUIET
+    def detect_regime_array(self, adx: np.ndarray, atr_ratio: np.ndarray) -> np.ndarray:
+        """
+        Classify many bars at once, e.g. per-bar regimes in a backtest.
 
-    def analyze(self, df: pd.DataFrame) -> RegimeAnalysis:
+        Applies the same thresholds as detect_regime() without branching
+        per bar; NaN inputs count as not trending / not volatile.
+
+        Args:
+            adx: ADX values
+            atr_ratio: ATR ratio values, same shape as adx
+
+        Returns:
+            int8 array of regime codes; _REGIME_LUT[code] is the MarketRegime
+        """
+        codes = np.greater(adx, self.adx_threshold).astype(np.int8)
+        codes *= 2
+        codes += np.greater_equal(atr_ratio, self.atr_vol_threshold)
+        return codes
+
+    def analyze(self, df: "pd.DataFrame") -> RegimeAnalysis:
         """
         Perform complete regime analysis.
 
+        With a DatetimeIndex, results for the last few distinct bar sets
+        are cached, keyed on the bar count, last bar timestamp and last
+        close, so several subscribers analyzing the same bars share one
+        computation (and one RegimeAnalysis object). This assumes
+        append-only bars for one symbol per detector: rows before the last
+        must not be edited. Other indexes (e.g. a RangeIndex over a
+        fixed-length window) repeat labels across bars and are not cached.
+
         Returns:
             RegimeAnalysis with all metrics and classification
         """
-        if len(df) < self.window_long:
-            return RegimeAnalysis(
-                regime=MarketRegime.UNKNOWN,
-                trend_strength=0.0,
-                volatility_ratio=1.0,
-                ema_value=0.0,
-                atr_value=0.0,
-                is_bullish=False,
-                is_bearish=False,
-                confidence=0.0,
-            )
+        high, low, close = _hlc(df)
+        if len(close) < self.window_long:
+            return _unknown_analysis()
+
+        index = df.index
+        if index.dtype.kind != "M":
+            return self.analyze_arrays(high, low, close)
+
+        key = (len(close), index[-1].value, float(close[-1]))
+        cache = self._analysis_cache
+        analysis = cache.pop(key, None)
+        if analysis is None:
+            analysis = self.analyze_arrays(high, low, close)
+            if len(cache) >= _ANALYSIS_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        # Re-insert so the dict stays in least- to most-recently-used order
+        cache[key] = analysis
+        return analysis
+
+    def analyze_arrays(
+        self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> RegimeAnalysis:
+        """
+        Perform complete regime analysis on high/low/close arrays.
+
+        Same result as analyze() without any pandas access, for callers
+        that already hold the bars as NumPy arrays (float32 or float64).
+
+        Returns:
+            RegimeAnalysis with all metrics and classification
+        """
+        if len(close) < self.window_long:
+            return _unknown_analysis()
 
         # Calculate indicators
-        adx = self.calculate_adx(df)
-        current_adx = float(adx.iloc[-1])
+        return self._build_analysis(*self._compute_all(high, low, close))
 
-        atr = self.calculate_atr(df)
-        current_atr = float(atr.iloc[-1])
+    def analyze_batch(
+        self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> List[RegimeAnalysis]:
+        """
+        Regime analysis for many symbols with equal-length histories.
 
-        atr_ratio = self.calculate_atr_ratio(df)
+        The fused kernel runs over the symbols in parallel threads; each
+        result agrees with analyze_arrays() on that symbol's row up to
+        float rounding.
 
-        ema = self.calculate_ema(df)
-        current_ema = float(ema.iloc[-1])
+        Args:
+            high, low, close: Bar prices of shape (symbols, bars)
 
-        current_price = float(df['close'].iloc[-1])
+        Returns:
+            RegimeAnalysis per symbol, in row order
+        """
+        if close.shape[1] < self.window_long:
+            return [_unknown_analysis() for _ in range(close.shape[0])]
+
+        adx, atr, atr_ratio = adx_atr_batch(high, low, close, self.window_short, self.window_long)
+        return [
+            self._build_analysis(
+                float(adx[r]),
+                float(atr[r]),
+                float(atr_ratio[r]),
+                ewm_last(close[r], self._alpha_ema),
+                float(close[r, -1]),
+            )
+            for r in range(close.shape[0])
+        ]
 
+    def _build_analysis(
+        self,
+        current_adx: float,
+        current_atr: float,
+        atr_ratio: float,
+        current_ema: float,
+        current_price: float,
+    ) -> RegimeAnalysis:
+        """Classify indicator values and score the confidence."""
         # Determine trend direction
         is_bullish = current_price > current_ema
         is_bearish = current_price < current_ema
 
         # Detect regime
-        regime = self.detect_regime(df)
+        regime = self._classify(current_adx, atr_ratio)
 
         # Calculate confidence (based on distance from thresholds)
         if self.adx_threshold > 0 and self.atr_vol_threshold > 0:
@@ -253,17 +437,105 @@ class RegimeDetector:
         else:
             confidence = 0.0
 
+        # Positional: keyword construction of a NamedTuple costs about twice as much
         return RegimeAnalysis(
-            regime=regime,
-            trend_strength=current_adx,
-            volatility_ratio=atr_ratio,
-            ema_value=current_ema,
-            atr_value=current_atr,
-            is_bullish=is_bullish,
-            is_bearish=is_bearish,
-            confidence=confidence,
+            regime, current_adx, atr_ratio, current_ema, current_atr, is_bullish, is_bearish, confidence
         )
 
+    def warmup(self, df: "pd.DataFrame") -> None:
+        """
+        Seed the streaming state of update() from a history of bars.
+
+        Without warmup(), update() starts from an empty history.
+        """
+        state = RegimeState(atr_hist=deque(maxlen=self.window_long))
+        high, low, close = _hlc(df)
+        if len(close):
+            atr, plus, minus, adx, atr_tail = adx_atr_kernel(
+                high, low, close, self.window_short, self.window_long, True
+            )
+            state.atr = float(atr)
+            state.plus_dm = float(plus)
+            state.minus_dm = float(minus)
+            state.adx = float(adx)
+            state.ema = float(ewm_mean(close, self._alpha_ema)[-1])
+            state.atr_hist.extend(atr_tail.tolist())
+            state.atr_sum = math.fsum(state.atr_hist)
+            state.prev_high = float(high[-1])
+            state.prev_low = float(low[-1])
+            state.prev_close = float(close[-1])
+            state.bars = len(close)
+        self._state = state
+
+    def update(self, high: float, low: float, close: float) -> RegimeAnalysis:
+        """
+        Advance the indicators by one new bar and analyze the result.
+
+        Each call applies one step of the ATR, +DM/-DM, ADX and EMA
+        recurrences, so a live bar costs O(1) instead of a full analyze().
+        For finite bars the result follows analyze() over the same bar
+        history; bars with NaN prices are not applied.
+
+        Returns:
+            RegimeAnalysis after the bar
+        """
+        state = self._state
+        if state is None:
+            state = self._state = RegimeState(atr_hist=deque(maxlen=self.window_long))
+
+        if math.isfinite(high) and math.isfinite(low) and math.isfinite(close):
+            self._advance(state, high, low, close)
+
+        if state.bars < self.window_long:
+            return _unknown_analysis()
+
+        atr_ratio = 1.0
+        avg_atr = state.atr_sum / self.window_long
+        if avg_atr > 0:
+            atr_ratio = state.atr / avg_atr
+        return self._build_analysis(state.adx, state.atr, atr_ratio, state.ema, state.prev_close)
+
+    def _advance(self, state: RegimeState, high: float, low: float, close: float) -> None:
+        """Apply one bar to the streaming state."""
+        tr = high - low
+        plus_dm = 0.0
+        minus_dm = 0.0
+        if state.bars:
+            pc = state.prev_close
+            tr = max(tr, abs(high - pc), abs(low - pc))
+            up_move = high - state.prev_high
+            down_move = state.prev_low - low
+            if up_move > down_move and up_move > 0:
+                plus_dm = up_move
+            elif down_move > up_move and down_move > 0:
+                minus_dm = down_move
+
+        alpha = self._alpha_short
+        decay = self._decay_short
+        state.atr = _ewm_update(state.atr, tr, alpha, decay)
+        state.plus_dm = _ewm_update(state.plus_dm, plus_dm, alpha, decay)
+        state.minus_dm = _ewm_update(state.minus_dm, minus_dm, alpha, decay)
+        if state.atr > 0:
+            plus_di = 100 * state.plus_dm / state.atr
+            minus_di = 100 * state.minus_dm / state.atr
+            dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
+            state.adx = _ewm_update(state.adx, dx, alpha, decay)
+        state.ema = _ewm_update(state.ema, close, self._alpha_ema, self._decay_ema)
+
+        # Running sum over the last window_long ATR values, re-summed exactly
+        # once per window so add/subtract rounding cannot drift over a session
+        if len(state.atr_hist) == state.atr_hist.maxlen:
+            state.atr_sum -= state.atr_hist[0]
+        state.atr_hist.append(state.atr)
+        state.atr_sum += state.atr
+        if state.bars % self.window_long == 0:
+            state.atr_sum = math.fsum(state.atr_hist)
+
+        state.prev_high = high
+        state.prev_low = low
+        state.prev_close = close
+        state.bars += 1
+
     def get_regime_description(self, regime: MarketRegime) -> str:
         """Get human-readable description of regime."""
         descriptions = {
@@ -9,31 +9,161 @@ Version: 9.5
 Note: Risk parameters loaded from production configuration.
 """
 
+import math
 import os
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional, Dict
-import logging
+from functools import lru_cache
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple, Union
 
-logger = logging.getLogger(__name__)
+import numpy as np
 
+# Production configuration, read once at import
+_CFG_MAX_MARGIN_RATIO = float(os.getenv("MAX_MARGIN_RATIO", "0"))
+_CFG_WARNING_THRESHOLD = float(os.getenv("WARNING_THRESHOLD", "0"))
+_CFG_EMERGENCY_DRAWDOWN = float(os.getenv("EMERGENCY_DRAWDOWN", "0"))
+_CFG_DAILY_LOSS_LIMIT = float(os.getenv("DAILY_LOSS_LIMIT", "0"))
 
-class RiskLevel(str, Enum):
-    """Risk level classification."""
-    SAFE = "safe"
-    WARNING = "warning"
-    BLOCKED = "blocked"
-    EMERGENCY = "emergency"
+# Distinct check_entry() inputs whose result is kept
+_ENTRY_CACHE_SIZE = 256
 
+# SAFE results use fixed messages; margin_ratio carries the number
+_MSG_ENTRY_ALLOWED = "Entry allowed"
+_MSG_DRAWDOWN_OK = "Drawdown within limits"
+_SAFE_MESSAGE_FORMATS = {
+    _MSG_ENTRY_ALLOWED: "Entry allowed: Margin at {:.1%}",
+    _MSG_DRAWDOWN_OK: "Drawdown: {:.1%}",
+}
 
-@dataclass
-class RiskCheckResult:
-    """Result of risk check."""
+
+class RiskLevel(IntEnum):
+    """
+    Risk level classification, ordered by severity.
+
+    Integer valued so levels compare natively and match the int8 codes
+    of the batch checks; use label for the lowercase name in logs/JSON.
+    """
+    SAFE = 0
+    WARNING = 1
+    BLOCKED = 2
+    EMERGENCY = 3
+
+    @property
+    def label(self) -> str:
+        """Lowercase level name, e.g. "safe"."""
+        return self.name.lower()
+
+
+# Members as module globals: RiskLevel.SAFE is a metaclass attribute lookup
+# on every result construction
+_SAFE = RiskLevel.SAFE
+_WARNING = RiskLevel.WARNING
+_BLOCKED = RiskLevel.BLOCKED
+_EMERGENCY = RiskLevel.EMERGENCY
+
+
+class RiskCheckResult(NamedTuple):
+    """
+    Result of risk check (immutable).
+
+    details and a formatted message are only built when a check blocks
+    or warns; SAFE results carry None and a fixed message, so the common
+    accept path allocates no dict or string. Use format_message() for a
+    log line that includes the ratio.
+    """
     allowed: bool
     risk_level: RiskLevel
     margin_ratio: float
     message: str
-    details: Optional[Dict] = None
+    details: Optional[Mapping] = None
+
+    def format_message(self) -> str:
+        """Human-readable message, with the ratio formatted in for SAFE results."""
+        fmt = _SAFE_MESSAGE_FORMATS.get(self.message)
+        return fmt.format(self.margin_ratio) if fmt else self.message
+
+
+# Shared results for the constant SAFE outcomes (nothing in use, equity at
+# its peak, no peak yet); results are immutable, so callers cannot alter them
+_SAFE_NO_MARGIN = RiskCheckResult(True, _SAFE, 0.0, _MSG_ENTRY_ALLOWED)
+_SAFE_AT_PEAK = RiskCheckResult(True, _SAFE, 0.0, _MSG_DRAWDOWN_OK)
+_SAFE_NO_PEAK = RiskCheckResult(True, _SAFE, 0, "No peak equity recorded")
+
+
+def _entry_limits(max_margin_ratio: float, warning_threshold: float) -> Tuple[float, float]:
+    """
+    Effective (warning, block) margin-ratio limits for level counting.
+
+    A zero limit is disabled (inf), and the warning limit is capped at the
+    block limit, so (ratio > warn) + (ratio > block) is 0 SAFE, 1 WARNING
+    or 2 BLOCKED exactly as the check_entry() rules give.
+    """
+    max_limit = max_margin_ratio if max_margin_ratio > 0 else math.inf
+    warn_limit = warning_threshold if warning_threshold > 0 else math.inf
+    return min(warn_limit, max_limit), max_limit
+
+
+@lru_cache(maxsize=_ENTRY_CACHE_SIZE)
+def _check_entry_cached(
+    equity: float,
+    current_margin: float,
+    proposed_margin: float,
+    max_margin_ratio: float,
+    warning_threshold: float,
+) -> RiskCheckResult:
+    """
+    CapitalGuard.check_entry() as a pure function of its inputs and limits.
+
+    Identical checks (e.g. neighbouring grid levels within one tick) share
+    one result instance, so details are read-only mappings.
+    """
+    if equity <= 0:
+        return RiskCheckResult(
+            allowed=False,
+            risk_level=_EMERGENCY,
+            margin_ratio=1.0,
+            message="Zero or negative equity",
+        )
+
+    # Calculate ratios
+    safe_balance = equity * max_margin_ratio
+    total_margin = current_margin + proposed_margin
+    margin_ratio = total_margin / equity
+
+    # Risk level from two compares instead of an if/elif ladder
+    warn_limit, max_limit = _entry_limits(max_margin_ratio, warning_threshold)
+    level = (margin_ratio > warn_limit) + (margin_ratio > max_limit)
+    if not level:
+        if margin_ratio == 0.0:
+            return _SAFE_NO_MARGIN
+        return RiskCheckResult(True, _SAFE, margin_ratio, _MSG_ENTRY_ALLOWED)
+
+    if level == _BLOCKED:
+        return RiskCheckResult(
+            allowed=False,
+            risk_level=_BLOCKED,
+            margin_ratio=margin_ratio,
+            message=f"Margin limit exceeded: {margin_ratio:.1%}",
+            details=MappingProxyType({
+                "equity": equity,
+                "current_margin": current_margin,
+                "proposed_margin": proposed_margin,
+                "total_margin": total_margin,
+                "safe_balance": safe_balance,
+            })
+        )
+
+    return RiskCheckResult(
+        allowed=True,
+        risk_level=_WARNING,
+        margin_ratio=margin_ratio,
+        message=f"Warning: Margin at {margin_ratio:.1%}",
+        details=MappingProxyType({
+            "equity": equity,
+            "total_margin": total_margin,
+            "remaining": safe_balance - total_margin,
+        })
+    )
 
 
 class CapitalGuard:
@@ -61,9 +191,9 @@ class CapitalGuard:
             emergency_drawdown: Emergency stop drawdown level
         """
         # Load from production config
-        self.max_margin_ratio = max_margin_ratio or float(os.getenv("MAX_MARGIN_RATIO", "0"))
-        self.warning_threshold = warning_threshold or float(os.getenv("WARNING_THRESHOLD", "0"))
-        self.emergency_drawdown = emergency_drawdown or float(os.getenv("EMERGENCY_DRAWDOWN", "0"))
+        self.max_margin_ratio = max_margin_ratio or _CFG_MAX_MARGIN_RATIO
+        self.warning_threshold = warning_threshold or _CFG_WARNING_THRESHOLD
+        self.emergency_drawdown = emergency_drawdown or _CFG_EMERGENCY_DRAWDOWN
 
     def check_entry(
         self,
@@ -74,6 +204,9 @@ class CapitalGuard:
         """
         Check if a new entry is allowed based on margin limits.
 
+        Repeated identical checks are answered from a small LRU cache and
+        return the same immutable result, with details as a read-only mapping.
+
         Args:
             equity: Current account equity
             current_margin: Currently used margin
@@ -82,59 +215,76 @@ class CapitalGuard:
         Returns:
             RiskCheckResult with decision and details
         """
-        if equity <= 0:
-            return RiskCheckResult(
-                allowed=False,
-                risk_level=RiskLevel.EMERGENCY,
-                margin_ratio=1.0,
-                message="Zero or negative equity",
-            )
+        return _check_entry_cached(
+            equity, current_margin, proposed_margin, self.max_margin_ratio, self.warning_threshold
+        )
 
-        # Calculate ratios
-        safe_balance = equity * self.max_margin_ratio
-        total_margin = current_margin + proposed_margin
-        margin_ratio = total_margin / equity
+    def session(self, equity: float, current_margin: float = 0) -> "RiskSession":
+        """
+        Entry checks against a fixed equity and current margin.
 
-        # Determine risk level and decision
-        if self.max_margin_ratio > 0 and margin_ratio > self.max_margin_ratio:
-            return RiskCheckResult(
-                allowed=False,
-                risk_level=RiskLevel.BLOCKED,
-                margin_ratio=margin_ratio,
-                message=f"Margin limit exceeded: {margin_ratio:.1%}",
-                details={
-                    "equity": equity,
-                    "current_margin": current_margin,
-                    "proposed_margin": proposed_margin,
-                    "total_margin": total_margin,
-                    "safe_balance": safe_balance,
-                }
-            )
+        Usage:
+            with guard.session(equity, current_margin) as s:
+                results = [s.check(m) for m in margins_per_level]
 
-        if self.warning_threshold > 0 and margin_ratio > self.warning_threshold:
-            return RiskCheckResult(
-                allowed=True,
-                risk_level=RiskLevel.WARNING,
-                margin_ratio=margin_ratio,
-                message=f"Warning: Margin at {margin_ratio:.1%}",
-                details={
-                    "equity": equity,
-                    "total_margin": total_margin,
-                    "remaining": safe_balance - total_margin,
-                }
+        Args:
+            equity: Current account equity
+            current_margin: Currently used margin
+
+        Returns:
+            RiskSession whose check() matches check_entry()
+        """
+        return RiskSession(self, equity, current_margin)
+
+    def check_entry_batch(
+        self,
+        equity: Union[float, np.ndarray],
+        current_margin: Union[float, np.ndarray],
+        proposed_margin: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized check_entry() over many proposed margins at once.
+
+        Each element gets the same decision as check_entry(); passing
+        margin_per_level * np.arange(1, max_levels + 1) tests every grid
+        depth in one call. Equity and current margin may also be per-element
+        arrays (e.g. one entry per symbol); all inputs broadcast.
+
+        Args:
+            equity: Current account equity
+            current_margin: Currently used margin
+            proposed_margin: Additional margin per candidate entry
+
+        Returns:
+            Tuple of (allowed, risk_level, margin_ratio) arrays; risk_level
+            holds int8 RiskLevel values
+        """
+        total_margin = current_margin + np.asarray(proposed_margin, dtype=np.float64)
+        no_equity = None
+        if np.ndim(equity) == 0:
+            if equity <= 0:
+                return (
+                    np.zeros(total_margin.shape, dtype=bool),
+                    np.full(total_margin.shape, _EMERGENCY, dtype=np.int8),
+                    np.ones(total_margin.shape),
+                )
+            margin_ratio = total_margin / equity
+        else:
+            equity = np.asarray(equity, dtype=np.float64)
+            no_equity = equity <= 0
+            margin_ratio = np.divide(
+                total_margin,
+                equity,
+                out=np.ones(np.broadcast_shapes(total_margin.shape, equity.shape)),
+                where=~no_equity,
             )
 
-        return RiskCheckResult(
-            allowed=True,
-            risk_level=RiskLevel.SAFE,
-            margin_ratio=margin_ratio,
-            message=f"Entry allowed: Margin at {margin_ratio:.1%}",
-            details={
-                "equity": equity,
-                "total_margin": total_margin,
-                "remaining": safe_balance - total_margin if safe_balance > 0 else 0,
-            }
-        )
+        warn_limit, max_limit = _entry_limits(self.max_margin_ratio, self.warning_threshold)
+        risk_level = np.greater(margin_ratio, warn_limit).view(np.int8)
+        risk_level += np.greater(margin_ratio, max_limit).view(np.int8)
+        if no_equity is not None:
+            np.copyto(risk_level, _EMERGENCY, where=no_equity)
+        return risk_level < _BLOCKED, risk_level, margin_ratio
 
     def check_grid_entry(
         self,
@@ -146,6 +296,9 @@ class CapitalGuard:
         """
         Check if full grid entry is allowed.
 
+        A grid blocked by the margin limit also reports how many of its
+        levels would fit in details["allowed_levels"].
+
         Args:
             equity: Current account equity
             margin_per_level: Margin required per grid level
@@ -156,7 +309,61 @@ class CapitalGuard:
             RiskCheckResult with decision and details
         """
         potential_margin = margin_per_level * max_levels
-        return self.check_entry(equity, current_margin, potential_margin)
+        result = self.check_entry(equity, current_margin, potential_margin)
+        if result.risk_level is _BLOCKED:
+            allowed_levels = self.max_admissible_levels(
+                equity, margin_per_level, max_levels, current_margin
+            )
+            result = result._replace(details=MappingProxyType(
+                {**(result.details or {}), "allowed_levels": allowed_levels}
+            ))
+        return result
+
+    def max_admissible_levels(
+        self,
+        equity: float,
+        margin_per_level: float,
+        max_levels: int,
+        current_margin: float = 0,
+    ) -> int:
+        """
+        Largest grid depth the margin limit admits, in closed form.
+
+        Returns the largest k <= max_levels for which check_entry() with
+        margin_per_level * k would not block, without trying each depth.
+
+        Args:
+            equity: Current account equity
+            margin_per_level: Margin required per grid level
+            max_levels: Maximum number of grid levels
+            current_margin: Currently used margin
+
+        Returns:
+            Number of admissible levels (0 if even the first is blocked)
+        """
+        if equity <= 0:
+            return 0
+        if not self.max_margin_ratio > 0:
+            return max_levels
+
+        def fits(levels: int) -> bool:
+            return not (current_margin + margin_per_level * levels) / equity > self.max_margin_ratio
+
+        if margin_per_level <= 0:
+            return max_levels if fits(max_levels) else 0
+
+        bound = (equity * self.max_margin_ratio - current_margin) / margin_per_level
+        if math.isfinite(bound):
+            levels = min(max(math.floor(bound), 0), max_levels)
+        else:
+            levels = max_levels if bound > 0 else 0
+        # The closed form can land one level off at the boundary; settle it
+        # with the exact check_entry() comparison
+        while levels < max_levels and fits(levels + 1):
+            levels += 1
+        while levels > 0 and not fits(levels):
+            levels -= 1
+        return levels
 
     def check_emergency_stop(
         self,
@@ -174,19 +381,14 @@ class CapitalGuard:
             RiskCheckResult indicating if emergency stop needed
         """
         if peak_equity <= 0:
-            return RiskCheckResult(
-                allowed=True,
-                risk_level=RiskLevel.SAFE,
-                margin_ratio=0,
-                message="No peak equity recorded",
-            )
+            return _SAFE_NO_PEAK
 
         drawdown = (peak_equity - current_equity) / peak_equity
 
         if self.emergency_drawdown > 0 and drawdown >= self.emergency_drawdown:
             return RiskCheckResult(
                 allowed=False,
-                risk_level=RiskLevel.EMERGENCY,
+                risk_level=_EMERGENCY,
                 margin_ratio=drawdown,
                 message=f"EMERGENCY STOP: Drawdown {drawdown:.1%}",
                 details={
@@ -197,9 +399,14 @@ class CapitalGuard:
             )
 
         warning_level = self.emergency_drawdown * 0.67 if self.emergency_drawdown > 0 else 0.10
+        if drawdown < warning_level:
+            if drawdown == 0.0:
+                return _SAFE_AT_PEAK
+            return RiskCheckResult(True, _SAFE, drawdown, _MSG_DRAWDOWN_OK)
+
         return RiskCheckResult(
             allowed=True,
-            risk_level=RiskLevel.SAFE if drawdown < warning_level else RiskLevel.WARNING,
+            risk_level=_WARNING,
             margin_ratio=drawdown,
             message=f"Drawdown: {drawdown:.1%}",
             details={
@@ -230,13 +437,20 @@ class CapitalGuard:
         Returns:
             Dict with position sizing information
         """
+        # Plain floats, so NumPy scalar inputs do not propagate into the result
+        equity = float(equity)
+        current_price = float(current_price)
+        current_margin = float(current_margin)
+
         # Calculate desired position
-        desired_value = equity * capital_pct
+        desired_value = equity * float(capital_pct)
         desired_margin = desired_value / leverage if leverage > 0 else desired_value
 
         # Check against limits
         safe_balance = equity * self.max_margin_ratio if self.max_margin_ratio > 0 else equity
-        available_margin = max(0, safe_balance - current_margin)
+        available_margin = safe_balance - current_margin
+        if not available_margin > 0:
+            available_margin = 0.0
 
         # Adjust if needed
         if desired_margin > available_margin:
@@ -249,7 +463,68 @@ class CapitalGuard:
             adjusted = False
 
         # Calculate quantity
-        quantity = actual_value / current_price if current_price > 0 else 0
+        quantity = actual_value / current_price if current_price > 0 else 0.0
+
+        return {
+            "desired_value": desired_value,
+            "desired_margin": desired_margin,
+            "actual_value": actual_value,
+            "actual_margin": actual_margin,
+            "quantity": quantity,
+            "adjusted": adjusted,
+            "margin_ratio": (current_margin + actual_margin) / equity if equity > 0 else 0.0,
+            "remaining_margin": available_margin - actual_margin,
+        }
+
+    def calculate_position_sizes_batch(
+        self,
+        equity: float,
+        capital_pcts: np.ndarray,
+        leverage: int,
+        prices: np.ndarray,
+        current_margin: float = 0,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_position_size() over many candidate sizes.
+
+        capital_pcts and prices broadcast against each other; each element
+        matches the scalar calculation for the same inputs.
+
+        Args:
+            equity: Current account equity
+            capital_pcts: Percentages of equity to use
+            leverage: Trading leverage
+            prices: Asset prices
+            current_margin: Currently used margin
+
+        Returns:
+            Dict of arrays with the same keys as calculate_position_size()
+        """
+        equity = float(equity)
+        current_margin = float(current_margin)
+        capital_pcts, prices = np.broadcast_arrays(
+            np.asarray(capital_pcts, dtype=np.float64), np.asarray(prices, dtype=np.float64)
+        )
+
+        desired_value = equity * capital_pcts
+        desired_margin = desired_value / leverage if leverage > 0 else desired_value
+
+        safe_balance = equity * self.max_margin_ratio if self.max_margin_ratio > 0 else equity
+        available_margin = safe_balance - current_margin
+        if not available_margin > 0:
+            available_margin = 0.0
+
+        # One clip instead of the scalar branch
+        adjusted = desired_margin > available_margin
+        actual_margin = np.where(adjusted, available_margin, desired_margin)
+        actual_value = np.where(
+            adjusted, actual_margin * leverage if leverage > 0 else actual_margin, desired_value
+        )
+        quantity = np.divide(actual_value, prices, out=np.zeros_like(actual_value), where=prices > 0)
+        if equity > 0:
+            margin_ratio = (current_margin + actual_margin) / equity
+        else:
+            margin_ratio = np.zeros_like(actual_margin)
 
         return {
             "desired_value": desired_value,
@@ -258,11 +533,64 @@ class CapitalGuard:
             "actual_margin": actual_margin,
             "quantity": quantity,
             "adjusted": adjusted,
-            "margin_ratio": (current_margin + actual_margin) / equity if equity > 0 else 0,
+            "margin_ratio": margin_ratio,
             "remaining_margin": available_margin - actual_margin,
         }
 
 
+class RiskSession:
+    """
+    CapitalGuard.check_entry() with the per-call invariants hoisted.
+
+    Equity, current margin and the effective limits are fixed when the
+    session is opened, so each check() is one add, one divide and two
+    compares; decisions and results match check_entry() exactly.
+    """
+
+    __slots__ = ("_guard", "_equity", "_current_margin", "_warn_limit", "_max_limit")
+
+    def __init__(self, guard: CapitalGuard, equity: float, current_margin: float = 0):
+        """
+        Open a session.
+
+        Args:
+            guard: CapitalGuard whose limits apply
+            equity: Current account equity
+            current_margin: Currently used margin
+        """
+        self._guard = guard
+        self._equity = equity
+        self._current_margin = current_margin
+        self._warn_limit, self._max_limit = _entry_limits(
+            guard.max_margin_ratio, guard.warning_threshold
+        )
+
+    def __enter__(self) -> "RiskSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def check(self, proposed_margin: float) -> RiskCheckResult:
+        """
+        Check one proposed entry.
+
+        Args:
+            proposed_margin: Additional margin for new entry
+
+        Returns:
+            RiskCheckResult as from check_entry()
+        """
+        equity = self._equity
+        if equity > 0:
+            margin_ratio = (self._current_margin + proposed_margin) / equity
+            if not (margin_ratio > self._warn_limit or margin_ratio > self._max_limit):
+                if margin_ratio == 0.0:
+                    return _SAFE_NO_MARGIN
+                return RiskCheckResult(True, _SAFE, margin_ratio, _MSG_ENTRY_ALLOWED)
+        return self._guard.check_entry(equity, self._current_margin, proposed_margin)
+
+
 class RiskManager:
     """
     Complete Risk Management System.
@@ -293,7 +621,7 @@ class RiskManager:
             max_margin_ratio=max_margin_ratio,
             emergency_drawdown=emergency_drawdown,
         )
-        self.daily_loss_limit = daily_loss_limit or float(os.getenv("DAILY_LOSS_LIMIT", "0"))
+        self.daily_loss_limit = daily_loss_limit or _CFG_DAILY_LOSS_LIMIT
         self.peak_equity = 0.0
         self.daily_starting_equity = 0.0
 
@@ -323,13 +651,19 @@ class RiskManager:
         Returns:
             RiskCheckResult with comprehensive risk check
         """
-        # 1. Check emergency stop
-        self.update_peak_equity(current_equity)
-        emergency_check = self.capital_guard.check_emergency_stop(
-            current_equity, self.peak_equity
-        )
-        if not emergency_check.allowed:
-            return emergency_check
+        guard = self.capital_guard
+
+        # 1. Check emergency stop; only a triggered stop overrides the margin
+        # check, so its result is only built then
+        peak_equity = self.peak_equity
+        if current_equity > peak_equity:
+            peak_equity = self.peak_equity = current_equity
+        if (
+            peak_equity > 0
+            and guard.emergency_drawdown > 0
+            and (peak_equity - current_equity) / peak_equity >= guard.emergency_drawdown
+        ):
+            return guard.check_emergency_stop(current_equity, peak_equity)
 
         # 2. Check daily loss limit
         if self.daily_starting_equity > 0 and self.daily_loss_limit > 0:
@@ -337,21 +671,107 @@ class RiskManager:
             if daily_pnl <= -self.daily_loss_limit:
                 return RiskCheckResult(
                     allowed=False,
-                    risk_level=RiskLevel.BLOCKED,
+                    risk_level=_BLOCKED,
                     margin_ratio=abs(daily_pnl),
                     message=f"Daily loss limit reached: {daily_pnl:.1%}",
                 )
 
         # 3. Check margin limits
-        return self.capital_guard.check_entry(
+        return guard.check_entry(
             current_equity, current_margin, proposed_margin
         )
 
 
-# Example usage
-if __name__ == "__main__":
-    print("Risk Manager - CapitalGuard V9.5")
-    print("=" * 50)
-    print("\nNote: Risk parameters loaded from environment.")
-    print("This public repository contains strategy structure only.")
-    print("\nFor competition evaluation, contact: @runwithcrypto")
+class PortfolioRiskState:
+    """
+    Risk state for many symbols as parallel arrays (structure of arrays).
+
+    Holds each symbol's high-water mark and daily starting equity in
+    NumPy arrays indexed by symbol id, so check_all_limits_batch()
+    applies RiskManager.check_all_limits() to every symbol in a few
+    vectorized passes instead of one Python call per symbol.
+    """
+
+    def __init__(
+        self,
+        n_symbols: int,
+        max_margin_ratio: float = None,
+        emergency_drawdown: float = None,
+        daily_loss_limit: float = None,
+    ):
+        """
+        Initialize portfolio risk state.
+
+        Args:
+            n_symbols: Number of tracked symbols
+            max_margin_ratio: Maximum margin usage
+            emergency_drawdown: Emergency stop level
+            daily_loss_limit: Maximum daily loss
+        """
+        self.capital_guard = CapitalGuard(
+            max_margin_ratio=max_margin_ratio,
+            emergency_drawdown=emergency_drawdown,
+        )
+        self.daily_loss_limit = daily_loss_limit or _CFG_DAILY_LOSS_LIMIT
+        self.peak_equity = np.zeros(n_symbols, dtype=np.float64)
+        self.daily_starting_equity = np.zeros(n_symbols, dtype=np.float64)
+
+    def reset_daily_stats(self, current_equity: np.ndarray):
+        """Reset daily statistics for all symbols (call at start of day)."""
+        self.daily_starting_equity[:] = current_equity
+
+    def check_all_limits_batch(
+        self,
+        current_equity: np.ndarray,
+        current_margin: np.ndarray,
+        proposed_margin: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        RiskManager.check_all_limits() for every symbol at once.
+
+        Args:
+            current_equity: Current equity per symbol
+            current_margin: Currently used margin per symbol
+            proposed_margin: Proposed additional margin per symbol
+
+        Returns:
+            Tuple of (allowed, risk_level, margin_ratio) arrays, as from
+            CapitalGuard.check_entry_batch()
+        """
+        guard = self.capital_guard
+        current_equity = np.asarray(current_equity, dtype=np.float64)
+
+        # fmax keeps the old peak where equity is NaN, like the scalar compare
+        peak_equity = np.fmax(self.peak_equity, current_equity, out=self.peak_equity)
+
+        # 3. Margin limits, then overridden by 2. daily loss and 1. emergency stop
+        _, risk_level, margin_ratio = guard.check_entry_batch(
+            current_equity, current_margin, proposed_margin
+        )
+
+        daily_start = self.daily_starting_equity
+        if self.daily_loss_limit > 0:
+            has_start = daily_start > 0
+            daily_pnl = np.divide(
+                current_equity - daily_start,
+                daily_start,
+                out=np.zeros_like(margin_ratio),
+                where=has_start,
+            )
+            hit = has_start & (daily_pnl <= -self.daily_loss_limit)
+            np.copyto(risk_level, _BLOCKED, where=hit)
+            np.copyto(margin_ratio, np.abs(daily_pnl), where=hit)
+
+        if guard.emergency_drawdown > 0:
+            has_peak = peak_equity > 0
+            drawdown = np.divide(
+                peak_equity - current_equity,
+                peak_equity,
+                out=np.zeros_like(margin_ratio),
+                where=has_peak,
+            )
+            hit = has_peak & (drawdown >= guard.emergency_drawdown)
+            np.copyto(risk_level, _EMERGENCY, where=hit)
+            np.copyto(margin_ratio, drawdown, where=hit)
+
+        return risk_level < _BLOCKED, risk_level, margin_ratio